@@ -5,6 +5,7 @@ import subprocess
 import shutil
 import re
 import shlex
+from typing import Mapping
 
 import typer
 from rich.console import Console
@@ -12,7 +13,7 @@ from rich.table import Table
 
 from .executor import run_prompt
 from .harness import PowerContext, load_test_suite, run_suite
-from .parser import load_power_spec, load_agent_spec, load_collection_spec, AgentSpecError, CollectionSpecError
+from .parser import load_power_spec, load_power_specs, load_agent_spec, load_collection_spec, AgentSpecError, CollectionSpecError
 from .router import select_powers
 from .security import validate_command_input, validate_identifier, redact_secrets
 from .steering import validate_steering as run_steering_validation
@@ -31,7 +32,7 @@ def _parse_list(value: str) -> list[str]:
     return [item for item in items if item]
 
 
-def _steering_templates(template_type: str) -> dict[str, str]:
+def _steering_templates(template_type: str) -> Mapping[str, str]:
     """Get steering templates using the template manager."""
     try:
         return get_steering_templates(template_type)
@@ -285,8 +286,8 @@ def _redact_secrets(text: str) -> str:
 
 
 def _select_steering_files(
-    templates: dict[str, str], selection: list[str] | None
-) -> dict[str, str]:
+    templates: Mapping[str, str], selection: list[str] | None
+) -> Mapping[str, str]:
     if selection:
         picked = {name: templates[name] for name in selection if name in templates}
         return picked if picked else templates
@@ -1361,17 +1362,9 @@ def route(
     effective_min_score = min_score if min_score is not None else config.router.min_score
     effective_max_results = max_results if max_results is not None else config.router.max_results
 
-    specs = []
-    for child in powers_dir.iterdir():
-        if not child.is_dir():
-            continue
-        spec_path = child / "POWER.md"
-        if spec_path.exists():
-            try:
-                specs.append(load_power_spec(spec_path))
-            except Exception as exc:
-                console.print(f"[yellow]Warning: Failed to load {spec_path}: {exc}[/yellow]")
-                continue
+    specs, load_errors = load_power_specs(powers_dir)
+    for spec_path, exc in load_errors:
+        console.print(f"[yellow]Warning: Failed to load {spec_path}: {exc}[/yellow]")
 
     matches = select_powers(
         specs, 
@@ -1922,19 +1915,15 @@ def list_agent_templates() -> None:
     from .templates import TemplateManager
     
     template_manager = TemplateManager()
-    templates = template_manager.get_agent_templates()
+    infos = template_manager.get_all_agent_template_infos()
     
-    if not templates:
+    if not infos:
         console.print("[yellow]No agent templates found[/yellow]")
         return
     
     console.print("[cyan]Available Agent Templates:[/cyan]")
-    for template in templates:
-        try:
-            info = template_manager.get_agent_template_info(template)
-            console.print(f"  [green]{template}[/green]: {info['description']}")
-        except Exception:
-            console.print(f"  [green]{template}[/green]: Agent template")
+    for info in infos:
+        console.print(f"  [green]{info['name']}[/green]: {info['description']}")
 
 
 @app.command()
@@ -1943,19 +1932,15 @@ def list_collection_templates() -> None:
     from .templates import TemplateManager
     
     template_manager = TemplateManager()
-    templates = template_manager.get_collection_templates()
+    infos = template_manager.get_all_collection_template_infos()
     
-    if not templates:
+    if not infos:
         console.print("[yellow]No collection templates found[/yellow]")
         return
     
     console.print("[cyan]Available Collection Templates:[/cyan]")
-    for template in templates:
-        try:
-            info = template_manager.get_collection_template_info(template)
-            console.print(f"  [green]{template}[/green]: {info['description']}")
-        except Exception:
-            console.print(f"  [green]{template}[/green]: Collection template")
+    for info in infos:
+        console.print(f"  [green]{info['name']}[/green]: {info['description']}")
 
 
 @app.command()
@@ -4,9 +4,13 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
+from rich.console import Console
+from rich.table import Table
 
+console = Console()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PowerContext:
     __test__ = False
     name: str
@@ -18,7 +22,7 @@ class PowerContext:
     requires_network: bool | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestCase:
     __test__ = False
     name: str
@@ -26,13 +30,13 @@ class TestCase:
     expected: list[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestSuite:
     __test__ = False
     cases: list[TestCase]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestResult:
     __test__ = False
     name: str
@@ -65,27 +69,24 @@ def _build_output(case: TestCase, context: PowerContext | None) -> str:
 
 
 def run_suite(suite: TestSuite, context: PowerContext | None = None) -> list[TestResult]:
-    results: list[TestResult] = []
+    # Collect plain (name, status, message) tuples and build results once at the end
+    outcomes: list[tuple[str, str, str]] = []
     for case in suite.cases:
         if not case.prompt.strip():
-            results.append(TestResult(case.name, "fail", "Missing prompt"))
+            outcomes.append((case.name, "fail", "Missing prompt"))
             continue
         if not case.expected:
-            results.append(TestResult(case.name, "fail", "Missing expected assertions"))
+            outcomes.append((case.name, "fail", "Missing expected assertions"))
             continue
         output = _build_output(case, context)
         missing = [text for text in case.expected if text not in output]
         if missing:
-            results.append(
-                TestResult(
-                    case.name,
-                    "fail",
-                    f"Missing expected text: {', '.join(missing)}",
-                )
+            outcomes.append(
+                (case.name, "fail", f"Missing expected text: {', '.join(missing)}")
             )
             continue
-        results.append(TestResult(case.name, "pass", "Assertions passed"))
-    return results
+        outcomes.append((case.name, "pass", "Assertions passed"))
+    return [TestResult(*outcome) for outcome in outcomes]
 # Agent and Collection Testing
 
 from .models import AgentSpec, CollectionSpec
@@ -194,11 +195,13 @@ def load_collection_test_suite(collection_dir: Path) -> dict:
     raise FileNotFoundError(f"No test file found in {collection_dir / 'tests'}")
 
 
-def run_agent_tests(agent_dir: Path) -> AgentTestContext:
+def run_agent_tests(agent_dir: Path, skip_validation: bool = False) -> AgentTestContext:
     """Run tests for an agent.
     
     Args:
         agent_dir: Path to agent directory
+        skip_validation: Skip agent validation because the caller already
+            validated this agent (e.g. as part of its collection)
         
     Returns:
         AgentTestContext: Test results
@@ -208,12 +211,15 @@ def run_agent_tests(agent_dir: Path) -> AgentTestContext:
     context = AgentTestContext(agent_dir, spec)
     
     # Validate agent first
-    validation_result = validate_agent(agent_dir)
-    context.add_result(
-        "Agent Validation",
-        validation_result.ok,
-        f"Validation issues: {len(validation_result.issues)}" if not validation_result.ok else "Valid"
-    )
+    if skip_validation:
+        context.add_result("Agent Validation", True, "Valid")
+    else:
+        validation_result = validate_agent(agent_dir)
+        context.add_result(
+            "Agent Validation",
+            validation_result.ok,
+            f"Validation issues: {len(validation_result.issues)}" if not validation_result.ok else "Valid"
+        )
     
     # Load and run behavioral tests
     try:
@@ -273,10 +279,14 @@ def run_collection_tests(collection_dir: Path) -> CollectionTestContext:
     # Test individual agents
     for agent_ref in spec.agents:
         agent_dir = collection_dir / agent_ref.path
-        agent_name = Path(agent_ref.path).name
+        agent_name = agent_dir.name
         
         if agent_dir.exists():
-            agent_context = run_agent_tests(agent_dir)
+            # Agents the collection validation already passed are not
+            # validated again; flagged or unvalidated ones are
+            agent_result = validation_result.agent_results.get(agent_ref.path)
+            already_validated = agent_result is not None and agent_result.ok
+            agent_context = run_agent_tests(agent_dir, skip_validation=already_validated)
             context.add_agent_context(agent_name, agent_context)
         else:
             # Create a failed context for missing agent
@@ -295,6 +305,7 @@ def run_collection_tests(collection_dir: Path) -> CollectionTestContext:
         
         # Run multi-agent scenarios
         scenarios = test_suite.get("scenarios", [])
+        registered_agents = frozenset(Path(agent.path).name for agent in spec.agents)
         for scenario in scenarios:
             scenario_name = scenario.get("name", "Unnamed scenario")
             
@@ -312,24 +323,20 @@ def run_collection_tests(collection_dir: Path) -> CollectionTestContext:
             )
             
             # Validate subagent call expectations
-            if has_subagent_calls:
-                subagent_calls = scenario["subagent_calls"]
-                registered_agents = {Path(agent.path).name for agent in spec.agents}
-                
-                for call in subagent_calls:
-                    agent_name = call.get("agent", "")
-                    if agent_name not in registered_agents:
-                        context.add_result(
-                            f"Subagent Reference: {agent_name}",
-                            False,
-                            f"Agent '{agent_name}' not registered in collection"
-                        )
-                    else:
-                        context.add_result(
-                            f"Subagent Reference: {agent_name}",
-                            True,
-                            "Valid agent reference"
-                        )
+            for call in scenario.get("subagent_calls") or ():
+                agent_name = call.get("agent", "")
+                if agent_name not in registered_agents:
+                    context.add_result(
+                        f"Subagent Reference: {agent_name}",
+                        False,
+                        f"Agent '{agent_name}' not registered in collection"
+                    )
+                else:
+                    context.add_result(
+                        f"Subagent Reference: {agent_name}",
+                        True,
+                        "Valid agent reference"
+                    )
             
             # TODO: Implement actual multi-agent scenario execution
             # This would involve:
@@ -352,11 +359,6 @@ def print_agent_test_results(context: AgentTestContext) -> None:
     Args:
         context: Agent test context with results
     """
-    from rich.console import Console
-    from rich.table import Table
-    
-    console = Console()
-    
     console.print(f"\n[cyan]Agent Test Results: {context.spec.meta.name}[/cyan]")
     
     table = Table(show_header=True, header_style="bold magenta")
@@ -383,11 +385,6 @@ def print_collection_test_results(context: CollectionTestContext) -> None:
     Args:
         context: Collection test context with results
     """
-    from rich.console import Console
-    from rich.table import Table
-    
-    console = Console()
-    
     console.print(f"\n[cyan]Collection Test Results: {context.spec.meta.name}[/cyan]")
     
     # Collection-level results
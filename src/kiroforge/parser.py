@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import io
+import os
 from pathlib import Path
+import stat
 from typing import Iterable
 
 import yaml
 
 from .models import PowerSpec
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Security: Maximum file size for YAML files (1MB)
 MAX_YAML_SIZE = 1024 * 1024
 
@@ -26,6 +35,41 @@ class PowerSpecSizeError(PowerSpecError):
     pass
 
 
+def _read_bounded(path: Path, max_size: int) -> tuple[bytes | None, int]:
+    """Read a regular file through a single descriptor, checking its size first.
+    
+    The type and size checks use fstat on the open descriptor, so no separate
+    exists/is_file/stat lookups are needed and the checks apply to the file
+    actually read.
+    
+    Args:
+        path: Path to the file
+        max_size: Maximum file size in bytes
+        
+    Returns:
+        Tuple of (content, size); content is None when size exceeds max_size
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        IsADirectoryError: If path is not a regular file
+        PermissionError: If file is not readable
+        OSError: If file cannot be read
+    """
+    # O_NONBLOCK keeps opening a FIFO from blocking before the type check
+    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NONBLOCK", 0)
+    fd = os.open(path, flags)
+    try:
+        file_stat = os.fstat(fd)
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise IsADirectoryError(f"Not a regular file: {path}")
+        if file_stat.st_size > max_size:
+            return None, file_stat.st_size
+        # Security: Never read more than the size checked above
+        return os.read(fd, file_stat.st_size), file_stat.st_size
+    finally:
+        os.close(fd)
+
+
 def load_power_spec(path: Path) -> PowerSpec:
     """Load and validate a power specification from POWER.md file.
     
@@ -41,36 +85,30 @@ def load_power_spec(path: Path) -> PowerSpec:
         FileNotFoundError: If file doesn't exist
         PermissionError: If file is not readable
     """
-    if not path.exists():
-        raise FileNotFoundError(f"POWER.md not found: {path}")
-    
-    if not path.is_file():
-        raise PowerSpecFormatError(f"POWER.md is not a file: {path}")
-    
-    # Security: Check file size to prevent DoS attacks
     try:
-        file_size = path.stat().st_size
-    except (OSError, PermissionError) as exc:
+        content, file_size = _read_bounded(path, MAX_YAML_SIZE)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"POWER.md not found: {path}") from None
+    except IsADirectoryError:
+        raise PowerSpecFormatError(f"POWER.md is not a file: {path}") from None
+    except PermissionError as exc:
         raise PermissionError(f"Cannot read POWER.md file: {exc}") from exc
+    except OSError as exc:
+        raise PowerSpecFormatError(f"Cannot read POWER.md: {exc}") from exc
     
-    if file_size > MAX_YAML_SIZE:
+    # Security: Check file size to prevent DoS attacks
+    if content is None:
         raise PowerSpecSizeError(
             f"POWER.md file too large: {file_size} bytes (max {MAX_YAML_SIZE})"
         )
     
     try:
-        raw = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError) as exc:
+        raw = content.decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
         raise PowerSpecFormatError(f"Cannot read POWER.md as UTF-8: {exc}") from exc
     
-    # Security: Additional check on content length after reading
-    if len(raw) > MAX_YAML_SIZE:
-        raise PowerSpecSizeError(
-            f"POWER.md content too large: {len(raw)} characters (max {MAX_YAML_SIZE})"
-        )
-    
     try:
-        data = yaml.safe_load(raw) or {}
+        data = yaml.load(raw, Loader=_SafeLoader) or {}
     except yaml.YAMLError as exc:
         raise PowerSpecFormatError(f"Invalid YAML format: {exc}") from exc
     
@@ -83,6 +121,36 @@ def load_power_spec(path: Path) -> PowerSpec:
         raise PowerSpecFormatError(f"Invalid power specification schema: {exc}") from exc
 
 
+def load_power_specs(powers_dir: Path) -> tuple[list[PowerSpec], list[tuple[Path, Exception]]]:
+    """Load the POWER.md of every power folder in a directory.
+    
+    Args:
+        powers_dir: Directory containing power folders
+        
+    Returns:
+        Tuple of (specs, errors); errors pairs each POWER.md that failed to
+        load with its exception
+        
+    Raises:
+        OSError: If powers_dir cannot be listed
+    """
+    specs: list[PowerSpec] = []
+    errors: list[tuple[Path, Exception]] = []
+    with os.scandir(powers_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            spec_path = Path(entry.path) / "POWER.md"
+            try:
+                specs.append(load_power_spec(spec_path))
+            except FileNotFoundError:
+                # Folders without a POWER.md are not powers
+                continue
+            except Exception as exc:
+                errors.append((spec_path, exc))
+    return specs, errors
+
+
 def list_power_files(base: Path, patterns: Iterable[str]) -> list[Path]:
     """List files matching glob patterns, with security validation.
     
@@ -93,7 +161,8 @@ def list_power_files(base: Path, patterns: Iterable[str]) -> list[Path]:
     Returns:
         List of matching file paths
     """
-    if not base.exists() or not base.is_dir():
+    # is_dir() is also False for a missing path, so one stat covers both
+    if not base.is_dir():
         return []
     
     results: list[Path] = []
@@ -149,6 +218,13 @@ class CollectionSpecSizeError(CollectionSpecError):
     pass
 
 
+def _named_yaml_stream(content: bytes, path: Path) -> io.BytesIO:
+    """Wrap file content for yaml.load so that error marks name the file."""
+    stream = io.BytesIO(content)
+    stream.name = str(path)
+    return stream
+
+
 def load_agent_spec(agent_dir: Path) -> AgentSpec:
     """Load and validate an agent specification from agent.yaml file.
     
@@ -167,17 +243,19 @@ def load_agent_spec(agent_dir: Path) -> AgentSpec:
     """
     agent_yaml = agent_dir / "agent.yaml"
     
-    if not agent_yaml.exists():
-        raise FileNotFoundError(f"Missing agent.yaml in {agent_dir}")
+    try:
+        content, file_size = _read_bounded(agent_yaml, MAX_AGENT_SPEC_SIZE)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing agent.yaml in {agent_dir}") from None
+    except PermissionError as exc:
+        raise PermissionError(f"Cannot read agent.yaml: {exc}")
     
     # Security: Validate file size
-    file_size = agent_yaml.stat().st_size
-    if file_size > MAX_AGENT_SPEC_SIZE:
+    if content is None:
         raise AgentSpecSizeError(f"agent.yaml too large: {file_size} bytes (max: {MAX_AGENT_SPEC_SIZE})")
     
     try:
-        with agent_yaml.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(_named_yaml_stream(content, agent_yaml), Loader=_SafeLoader)
         
         if not isinstance(data, dict):
             raise AgentSpecFormatError("agent.yaml must contain a YAML object")
@@ -188,8 +266,6 @@ def load_agent_spec(agent_dir: Path) -> AgentSpec:
         raise AgentSpecFormatError(f"Invalid YAML in agent.yaml: {exc}")
     except ValidationError as exc:
         raise AgentSpecError(f"Agent specification validation failed: {exc}")
-    except PermissionError as exc:
-        raise PermissionError(f"Cannot read agent.yaml: {exc}")
 
 
 def load_collection_spec(collection_dir: Path) -> CollectionSpec:
@@ -210,17 +286,19 @@ def load_collection_spec(collection_dir: Path) -> CollectionSpec:
     """
     collection_yaml = collection_dir / "collection.yaml"
     
-    if not collection_yaml.exists():
-        raise FileNotFoundError(f"Missing collection.yaml in {collection_dir}")
+    try:
+        content, file_size = _read_bounded(collection_yaml, MAX_COLLECTION_SPEC_SIZE)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing collection.yaml in {collection_dir}") from None
+    except PermissionError as exc:
+        raise PermissionError(f"Cannot read collection.yaml: {exc}")
     
     # Security: Validate file size
-    file_size = collection_yaml.stat().st_size
-    if file_size > MAX_COLLECTION_SPEC_SIZE:
+    if content is None:
         raise CollectionSpecSizeError(f"collection.yaml too large: {file_size} bytes (max: {MAX_COLLECTION_SPEC_SIZE})")
     
     try:
-        with collection_yaml.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(_named_yaml_stream(content, collection_yaml), Loader=_SafeLoader)
         
         if not isinstance(data, dict):
             raise CollectionSpecFormatError("collection.yaml must contain a YAML object")
@@ -231,8 +309,6 @@ def load_collection_spec(collection_dir: Path) -> CollectionSpec:
         raise CollectionSpecFormatError(f"Invalid YAML in collection.yaml: {exc}")
     except ValidationError as exc:
         raise CollectionSpecError(f"Collection specification validation failed: {exc}")
-    except PermissionError as exc:
-        raise PermissionError(f"Cannot read collection.yaml: {exc}")
 
 
 def normalize_power_reference(power_ref: str | dict) -> dict:
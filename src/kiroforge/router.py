@@ -1,47 +1,173 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from fnmatch import fnmatch
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from fnmatch import translate
 from typing import Iterable
+import os
 import re
+import sys
 from difflib import SequenceMatcher
 
 from .models import PowerSpec
 
 
-@dataclass
+# Maximum number of (prompt, files) results remembered per power
+_MATCH_CACHE_SIZE = 256
+
+# Maximum number of distinct power trigger sets whose derived terms are kept
+_SPEC_TERMS_CACHE_SIZE = 1024
+
+# Catalog size from which scoring is spread across threads
+_PARALLEL_MIN_SPECS = 32
+
+
+# How each kind of routing reason is rendered after its "kind:" prefix
+_REASON_FORMATS = {
+    "exact_phrase": "{name}",
+    "fuzzy_phrase": "{name}({value:.2f})",
+    "exact_domain": "{name}",
+    "keyword_domain": "{name}({value:.2f})",
+    "files": "{name}({value})",
+    "semantic": "{name}({value:.2f})",
+    "completeness_bonus": "{value}",
+}
+
+
+@dataclass(frozen=True)
 class RouteMatch:
     name: str
     score: int
-    reasons: list[str]
+    # (kind, name, value) triples; formatted only when reasons is read
+    reasons_raw: tuple[tuple[str, str, float], ...]
+
+    @cached_property
+    def reasons(self) -> tuple[str, ...]:
+        """Human-readable reasons, e.g. ``fuzzy_phrase:review code(0.75)``."""
+        return tuple(
+            f"{kind}:" + _REASON_FORMATS[kind].format(name=name, value=value)
+            for kind, name, value in self.reasons_raw
+        )
+
+
+def _calculate_similarity(
+    text1: str, text2: str, cutoff: float = 0.0, matcher: SequenceMatcher | None = None
+) -> float:
+    """Calculate similarity between two lowercased strings using sequence matching.
+
+    Returns 0.0 without running the full O(N*M) match when the cheap upper
+    bounds already show the ratio cannot exceed ``cutoff``. A ``matcher``
+    whose second sequence is already ``text2`` can be passed in to reuse
+    its index of ``text2`` across calls.
+    """
+    total = len(text1) + len(text2)
+    if not total:
+        return 1.0 if cutoff < 1.0 else 0.0
+    # Same bound as real_quick_ratio(), checked before building any matcher
+    if 2.0 * min(len(text1), len(text2)) / total <= cutoff:
+        return 0.0
+    if matcher is None:
+        matcher = SequenceMatcher(None, text1, text2)
+    else:
+        matcher.set_seq1(text1)
+    if matcher.quick_ratio() <= cutoff:
+        return 0.0
+    return matcher.ratio()
+
 
+# Whole alphanumeric words of at least three characters in lowercased text;
+# the length filter runs inside the regex engine rather than in Python
+_KEYWORD_RE = re.compile(r'\b[a-z0-9]{3,}\b')
 
-def _calculate_similarity(text1: str, text2: str) -> float:
-    """Calculate similarity between two strings using sequence matching."""
-    return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+# Common stop words ignored when extracting keywords
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should'
+})
 
 
 def _extract_keywords(text: str) -> set[str]:
     """Extract meaningful keywords from text."""
-    # Remove common stop words and extract meaningful terms
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-        'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
-        'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should'
-    }
-    
-    # Extract words (alphanumeric sequences)
-    words = re.findall(r'\b[a-zA-Z0-9]+\b', text.lower())
-    
-    # Filter out stop words and short words
-    keywords = {word for word in words if len(word) > 2 and word not in stop_words}
-    
-    return keywords
+    # Extract words (alphanumeric sequences), then filter out stop words
+    return set(_KEYWORD_RE.findall(text.lower())).difference(_STOP_WORDS)
+
+
+@dataclass(frozen=True, slots=True)
+class _SpecTerms:
+    """Lowercased triggers and keywords of a power, derived once per trigger set."""
+    phrases: tuple[tuple[str, str], ...]
+    domains: tuple[tuple[str, str, frozenset[str]], ...]
+    description_keywords: frozenset[str]
+    file_patterns: tuple[tuple[str, re.Pattern[str]], ...]
+    # Number of trigger kinds (phrases, domains, files) the power defines
+    completeness: int
+    # Recent score_power results keyed by (prompt, files), oldest first; they
+    # depend only on the inputs the terms are keyed on, so they share their
+    # lifetime and equal specs share them
+    matches: OrderedDict[tuple[str, tuple[str, ...]], RouteMatch] = field(
+        default_factory=OrderedDict, compare=False
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _PromptTerms:
+    """Lowercased prompt and its keywords, derived once per routing request."""
+    text: str
+    lower: str
+    keywords: frozenset[str]
 
+    @classmethod
+    def from_prompt(cls, prompt: str) -> _PromptTerms:
+        return cls(prompt, prompt.lower(), frozenset(_extract_keywords(prompt)))
 
-def _score_keyword_overlap(prompt_keywords: set[str], target_keywords: set[str]) -> float:
+
+def _spec_terms(spec: PowerSpec) -> _SpecTerms:
+    """Return the routing terms for a spec's current triggers and meta."""
+    # Keyed on a snapshot of every input, so copied or edited specs never
+    # see terms derived from other triggers
+    triggers = spec.triggers
+    return _derive_spec_terms(
+        spec.meta.name,
+        spec.meta.description,
+        tuple(triggers.phrases),
+        tuple(triggers.domains),
+        tuple(triggers.files),
+    )
+
+
+@lru_cache(maxsize=_SPEC_TERMS_CACHE_SIZE)
+def _derive_spec_terms(
+    name: str,
+    description: str,
+    phrases: tuple[str, ...],
+    domains: tuple[str, ...],
+    files: tuple[str, ...],
+) -> _SpecTerms:
+    return _SpecTerms(
+        phrases=tuple((phrase, phrase.lower()) for phrase in phrases),
+        domains=tuple(
+            (domain, domain.lower(), frozenset(_extract_keywords(domain)))
+            for domain in domains
+        ),
+        description_keywords=frozenset(_extract_keywords(description)),
+        # Same semantics as fnmatch.fnmatch, compiled once per pattern
+        file_patterns=tuple(
+            (pattern, re.compile(translate(os.path.normcase(pattern))))
+            for pattern in files
+        ),
+        completeness=(1 if phrases else 0) + (1 if domains else 0) + (1 if files else 0),
+    )
+
+
+def _score_keyword_overlap(
+    prompt_keywords: frozenset[str], target_keywords: frozenset[str]
+) -> float:
     """Score keyword overlap between prompt and target."""
-    if not prompt_keywords or not target_keywords:
+    # Disjoint sets score 0.0; skip building the union for them
+    if prompt_keywords.isdisjoint(target_keywords):
         return 0.0
     
     intersection = prompt_keywords & target_keywords
@@ -54,71 +180,110 @@ def _score_keyword_overlap(prompt_keywords: set[str], target_keywords: set[str])
 def score_power(
     spec: PowerSpec, prompt: str, files: Iterable[str] | None = None
 ) -> RouteMatch:
-    """Score a power against a prompt with improved intelligence."""
+    """Score a power against a prompt with improved intelligence.
+
+    Results are memoized per power for repeated (prompt, files) pairs.
+    """
+    files = tuple(files) if files else ()
+    return _score_cached(spec, prompt, None, files)
+
+
+def _score_cached(
+    spec: PowerSpec, prompt: str, prompt_terms: _PromptTerms | None, files: tuple[str, ...]
+) -> RouteMatch:
+    terms = _spec_terms(spec)
+    key = (prompt, files)
+    cache = terms.matches
+    match = cache.get(key)
+    if match is not None:
+        try:
+            cache.move_to_end(key)
+        except KeyError:
+            # Evicted meanwhile by another thread scoring an equal spec
+            pass
+        return match
+
+    if prompt_terms is None:
+        prompt_terms = _PromptTerms.from_prompt(prompt)
+    match = _score_power(spec, terms, prompt_terms, files)
+    cache[key] = match
+    if len(cache) > _MATCH_CACHE_SIZE:
+        cache.popitem(last=False)
+    return match
+
+
+def _score_power(
+    spec: PowerSpec, terms: _SpecTerms, prompt_terms: _PromptTerms, files: tuple[str, ...]
+) -> RouteMatch:
     score = 0
-    reasons: list[str] = []
-    prompt_lower = prompt.lower()
-    prompt_keywords = _extract_keywords(prompt)
+    reasons: list[tuple[str, str, float]] = []
+    prompt_lower = prompt_terms.lower
+    prompt_keywords = prompt_terms.keywords
+    # Built on the first fuzzy comparison so its index of the prompt is shared
+    matcher: SequenceMatcher | None = None
 
     # Exact phrase matching (highest weight)
-    for phrase in spec.triggers.phrases:
-        phrase_lower = phrase.lower()
+    for phrase, phrase_lower in terms.phrases:
         if phrase_lower in prompt_lower:
             score += 10  # Increased from 3
-            reasons.append(f"exact_phrase:{phrase}")
+            reasons.append(("exact_phrase", phrase, 0))
         else:
             # Fuzzy phrase matching
-            similarity = _calculate_similarity(phrase_lower, prompt_lower)
+            if matcher is None:
+                matcher = SequenceMatcher(None, "", prompt_lower)
+            similarity = _calculate_similarity(
+                phrase_lower, prompt_lower, cutoff=0.6, matcher=matcher
+            )
             if similarity > 0.6:  # 60% similarity threshold
                 fuzzy_score = int(similarity * 5)  # 0-5 points
                 score += fuzzy_score
-                reasons.append(f"fuzzy_phrase:{phrase}({similarity:.2f})")
+                reasons.append(("fuzzy_phrase", phrase, similarity))
 
     # Domain matching with keyword overlap
-    for domain in spec.triggers.domains:
-        domain_lower = domain.lower()
+    for domain, domain_lower, domain_keywords in terms.domains:
         if domain_lower in prompt_lower:
             score += 5  # Increased from 2
-            reasons.append(f"exact_domain:{domain}")
+            reasons.append(("exact_domain", domain, 0))
         else:
             # Check if domain keywords overlap with prompt
-            domain_keywords = _extract_keywords(domain)
             overlap_score = _score_keyword_overlap(prompt_keywords, domain_keywords)
             if overlap_score > 0.3:  # 30% overlap threshold
                 keyword_score = int(overlap_score * 3)  # 0-3 points
                 score += keyword_score
-                reasons.append(f"keyword_domain:{domain}({overlap_score:.2f})")
+                reasons.append(("keyword_domain", domain, overlap_score))
 
     # Enhanced file pattern matching
-    if files:
-        for pattern in spec.triggers.files:
-            matched_files = [f for f in files if fnmatch(f, pattern)]
-            if matched_files:
+    if files and terms.file_patterns:
+        normalized_files = [os.path.normcase(f) for f in files]
+        for pattern, pattern_re in terms.file_patterns:
+            matched_count = sum(1 for f in normalized_files if pattern_re.match(f))
+            if matched_count:
                 # Score based on number of matching files
-                file_score = min(len(matched_files) * 2, 8)  # Cap at 8 points
+                file_score = min(matched_count * 2, 8)  # Cap at 8 points
                 score += file_score
-                reasons.append(f"files:{pattern}({len(matched_files)})")
+                reasons.append(("files", pattern, matched_count))
 
     # Semantic matching based on description
     if spec.meta.description:
-        desc_keywords = _extract_keywords(spec.meta.description)
-        desc_overlap = _score_keyword_overlap(prompt_keywords, desc_keywords)
+        desc_overlap = _score_keyword_overlap(prompt_keywords, terms.description_keywords)
         if desc_overlap > 0.2:  # 20% overlap threshold
             semantic_score = int(desc_overlap * 4)  # 0-4 points
             score += semantic_score
-            reasons.append(f"semantic:{spec.meta.name}({desc_overlap:.2f})")
+            reasons.append(("semantic", spec.meta.name, desc_overlap))
 
     # Boost score for powers with more comprehensive triggers
-    trigger_completeness = (
-        (1 if spec.triggers.phrases else 0) +
-        (1 if spec.triggers.domains else 0) +
-        (1 if spec.triggers.files else 0)
-    )
+    trigger_completeness = terms.completeness
     if trigger_completeness > 1:
         score += trigger_completeness  # 1-3 bonus points
-        reasons.append(f"completeness_bonus:{trigger_completeness}")
+        reasons.append(("completeness_bonus", "", trigger_completeness))
+
+    return RouteMatch(name=spec.meta.name, score=score, reasons_raw=tuple(reasons))
+
 
-    return RouteMatch(name=spec.meta.name, score=score, reasons=reasons)
+def _gil_enabled() -> bool:
+    """Return False only on a free-threaded interpreter running without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
 
 
 def select_powers(
@@ -137,7 +302,20 @@ def select_powers(
     Returns:
         List of matching powers, ranked by score
     """
-    matches = [score_power(spec, prompt, files=files) for spec in specs]
+    specs = list(specs)
+    files = tuple(files) if files else ()
+    # Tokenize the prompt once for the whole catalog
+    prompt_terms = _PromptTerms.from_prompt(prompt)
+
+    def score(spec: PowerSpec) -> RouteMatch:
+        return _score_cached(spec, prompt, prompt_terms, files)
+
+    if len(specs) >= _PARALLEL_MIN_SPECS and not _gil_enabled():
+        # Scoring is independent per power; threads only help without a GIL
+        with ThreadPoolExecutor() as executor:
+            matches = list(executor.map(score, specs))
+    else:
+        matches = [score(spec) for spec in specs]
     
     # Filter by minimum score and sort by score (descending)
     ranked = [match for match in matches if match.score >= min_score]
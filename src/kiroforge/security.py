@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -31,6 +32,17 @@ def validate_file_path(base_dir: Path, file_path: Path | str) -> bool:
         return False
 
 
+# Patterns that could indicate injection attempts, in reporting order
+_SUSPICIOUS_INPUT_PATTERNS = (
+    r'[;&|`$()]',  # Shell metacharacters
+    r'\\x[0-9a-fA-F]{2}',  # Hex escape sequences
+    r'[\x00-\x1f\x7f-\x9f]',  # Control characters
+)
+
+# All suspicious patterns combined so clean input is scanned only once
+_SUSPICIOUS_INPUT_RE = re.compile("|".join(_SUSPICIOUS_INPUT_PATTERNS))
+
+
 def validate_command_input(input_text: str, max_length: int = 50000) -> None:
     """
     Validate command input for security issues.
@@ -42,25 +54,33 @@ def validate_command_input(input_text: str, max_length: int = 50000) -> None:
     Raises:
         ValueError: If input is invalid or potentially dangerous
     """
-    if not input_text or not input_text.strip():
+    # isspace() stops at the first visible character; strip() would copy
+    if not input_text or input_text.isspace():
         raise ValueError("Input cannot be empty")
     
     if len(input_text) > max_length:
         raise ValueError(f"Input too long (max {max_length} characters)")
     
     # Check for suspicious patterns that could indicate injection attempts
-    suspicious_patterns = [
-        r'[;&|`$()]',  # Shell metacharacters
-        r'\\x[0-9a-fA-F]{2}',  # Hex escape sequences
-        r'[\x00-\x1f\x7f-\x9f]',  # Control characters
-    ]
-    
-    for pattern in suspicious_patterns:
-        if re.search(pattern, input_text):
-            raise ValueError(f"Input contains suspicious characters: {pattern}")
+    if _SUSPICIOUS_INPUT_RE.search(input_text):
+        pattern = next(
+            pattern for pattern in _SUSPICIOUS_INPUT_PATTERNS
+            if re.search(pattern, input_text)
+        )
+        raise ValueError(f"Input contains suspicious characters: {pattern}")
+
+
+_DEFAULT_IDENTIFIER_PATTERN = r'^[a-zA-Z0-9_-]+$'
+_DEFAULT_IDENTIFIER_RE = re.compile(_DEFAULT_IDENTIFIER_PATTERN)
 
 
-def validate_identifier(identifier: str, pattern: str = r'^[a-zA-Z0-9_-]+$') -> bool:
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a caller-supplied pattern once per distinct pattern."""
+    return re.compile(pattern)
+
+
+def validate_identifier(identifier: str, pattern: str = _DEFAULT_IDENTIFIER_PATTERN) -> bool:
     """
     Validate that an identifier matches a safe pattern.
     
@@ -71,7 +91,86 @@ def validate_identifier(identifier: str, pattern: str = r'^[a-zA-Z0-9_-]+$') ->
     Returns:
         True if valid, False otherwise
     """
-    return bool(re.match(pattern, identifier))
+    if pattern == _DEFAULT_IDENTIFIER_PATTERN:
+        regex = _DEFAULT_IDENTIFIER_RE
+    else:
+        regex = _compile_pattern(pattern)
+    return bool(regex.match(identifier))
+
+
+# Secret patterns mapped to their replacement and a lowercase literal that
+# every match must contain (None when there is no such literal). Order
+# matters: each substitution runs over the output of the previous one.
+_SECRET_PATTERN_SOURCES = {
+    # Stripe keys
+    r"sk_live_[A-Za-z0-9]+": ("sk_live_REDACTED", "sk_live_"),
+    r"sk_test_[A-Za-z0-9]+": ("sk_test_REDACTED", "sk_test_"),
+    r"pk_live_[A-Za-z0-9]+": ("pk_live_REDACTED", "pk_live_"),
+    r"pk_test_[A-Za-z0-9]+": ("pk_test_REDACTED", "pk_test_"),
+    r"rk_live_[A-Za-z0-9]+": ("rk_live_REDACTED", "rk_live_"),
+    r"rk_test_[A-Za-z0-9]+": ("rk_test_REDACTED", "rk_test_"),
+    
+    # JWT tokens
+    r"eyJ[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+": ("jwt_REDACTED", "eyj"),
+    
+    # AWS keys
+    r"AKIA[0-9A-Z]{16}": ("AKIA_REDACTED", "akia"),
+    r"ASIA[0-9A-Z]{16}": ("ASIA_REDACTED", "asia"),
+    r"[A-Za-z0-9/+=]{40}": ("aws_secret_REDACTED", None),
+    
+    # GitHub tokens
+    r"ghp_[A-Za-z0-9]{36}": ("ghp_REDACTED", "ghp_"),
+    r"gho_[A-Za-z0-9]{36}": ("gho_REDACTED", "gho_"),
+    r"ghu_[A-Za-z0-9]{36}": ("ghu_REDACTED", "ghu_"),
+    r"ghs_[A-Za-z0-9]{36}": ("ghs_REDACTED", "ghs_"),
+    r"ghr_[A-Za-z0-9]{36}": ("ghr_REDACTED", "ghr_"),
+    
+    # Generic API keys and tokens
+    r"[Aa][Pp][Ii]_?[Kk][Ee][Yy]\s*[:=]\s*['\"]?([A-Za-z0-9_-]{20,})['\"]?": ("API_KEY=REDACTED", "api"),
+    r"[Aa][Cc][Cc][Ee][Ss][Ss]_?[Tt][Oo][Kk][Ee][Nn]\s*[:=]\s*['\"]?([A-Za-z0-9_-]{20,})['\"]?": ("ACCESS_TOKEN=REDACTED", "access"),
+    r"[Bb][Ee][Aa][Rr][Ee][Rr]\s+([A-Za-z0-9_-]{20,})": ("Bearer REDACTED", "bearer"),
+    
+    # Database URLs
+    r"(postgres|mysql|mongodb)://[^:]+:[^@]+@[^/]+/[^\s]+": ("DATABASE_URL_REDACTED", "://"),
+    
+    # Private keys
+    r"-----BEGIN [A-Z ]+PRIVATE KEY-----[^-]+-----END [A-Z ]+PRIVATE KEY-----": ("PRIVATE_KEY_REDACTED", "-----begin "),
+    
+    # SSH keys
+    r"ssh-rsa [A-Za-z0-9+/=]+": ("SSH_KEY_REDACTED", "ssh-rsa "),
+    r"ssh-ed25519 [A-Za-z0-9+/=]+": ("SSH_KEY_REDACTED", "ssh-ed25519 "),
+    
+    # Environment variables with secrets
+    r"[A-Z_]+_SECRET\s*[:=]\s*['\"]?([A-Za-z0-9_-]{8,})['\"]?": ("SECRET_REDACTED", "_secret"),
+    r"[A-Z_]+_PASSWORD\s*[:=]\s*['\"]?([A-Za-z0-9_-]{8,})['\"]?": ("PASSWORD_REDACTED", "_password"),
+    
+    # Credit card numbers
+    r"\b(?:\d{4}[-\s]?){3}\d{4}\b": ("CREDIT_CARD_REDACTED", None),
+    
+    # Email addresses
+    r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b": ("EMAIL_REDACTED", "@"),
+    
+    # Phone numbers
+    r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b": ("PHONE_REDACTED", None),
+    
+    # IP addresses
+    r"\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b": ("IP_REDACTED", "."),
+    
+    # UUIDs
+    r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b": ("UUID_REDACTED", "-"),
+    
+    # Platform-specific tokens
+    r"xox[baprs]-[0-9a-zA-Z-]+": ("SLACK_TOKEN_REDACTED", "xox"),
+    r"[MN][A-Za-z0-9]{23}\.[A-Za-z0-9_-]{6}\.[A-Za-z0-9_-]{27}": ("DISCORD_TOKEN_REDACTED", "."),
+    r"AIza[0-9A-Za-z-_]{35}": ("GOOGLE_API_KEY_REDACTED", "aiza"),
+    r"EAA[0-9A-Za-z]+": ("FACEBOOK_TOKEN_REDACTED", "eaa"),
+    r"[1-9][0-9]+-[0-9a-zA-Z]{40}": ("TWITTER_TOKEN_REDACTED", "-"),
+}
+
+_SECRET_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement, hint)
+    for pattern, (replacement, hint) in _SECRET_PATTERN_SOURCES.items()
+)
 
 
 def redact_secrets(text: str) -> str:
@@ -84,78 +183,28 @@ def redact_secrets(text: str) -> str:
     Returns:
         Text with sensitive information redacted
     """
-    patterns = {
-        # Stripe keys
-        r"sk_live_[A-Za-z0-9]+": "sk_live_REDACTED",
-        r"sk_test_[A-Za-z0-9]+": "sk_test_REDACTED",
-        r"pk_live_[A-Za-z0-9]+": "pk_live_REDACTED",
-        r"pk_test_[A-Za-z0-9]+": "pk_test_REDACTED",
-        r"rk_live_[A-Za-z0-9]+": "rk_live_REDACTED",
-        r"rk_test_[A-Za-z0-9]+": "rk_test_REDACTED",
-        
-        # JWT tokens
-        r"eyJ[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+": "jwt_REDACTED",
-        
-        # AWS keys
-        r"AKIA[0-9A-Z]{16}": "AKIA_REDACTED",
-        r"ASIA[0-9A-Z]{16}": "ASIA_REDACTED",
-        r"[A-Za-z0-9/+=]{40}": "aws_secret_REDACTED",
-        
-        # GitHub tokens
-        r"ghp_[A-Za-z0-9]{36}": "ghp_REDACTED",
-        r"gho_[A-Za-z0-9]{36}": "gho_REDACTED",
-        r"ghu_[A-Za-z0-9]{36}": "ghu_REDACTED",
-        r"ghs_[A-Za-z0-9]{36}": "ghs_REDACTED",
-        r"ghr_[A-Za-z0-9]{36}": "ghr_REDACTED",
-        
-        # Generic API keys and tokens
-        r"[Aa][Pp][Ii]_?[Kk][Ee][Yy]\s*[:=]\s*['\"]?([A-Za-z0-9_-]{20,})['\"]?": "API_KEY=REDACTED",
-        r"[Aa][Cc][Cc][Ee][Ss][Ss]_?[Tt][Oo][Kk][Ee][Nn]\s*[:=]\s*['\"]?([A-Za-z0-9_-]{20,})['\"]?": "ACCESS_TOKEN=REDACTED",
-        r"[Bb][Ee][Aa][Rr][Ee][Rr]\s+([A-Za-z0-9_-]{20,})": "Bearer REDACTED",
-        
-        # Database URLs
-        r"(postgres|mysql|mongodb)://[^:]+:[^@]+@[^/]+/[^\s]+": "DATABASE_URL_REDACTED",
-        
-        # Private keys
-        r"-----BEGIN [A-Z ]+PRIVATE KEY-----[^-]+-----END [A-Z ]+PRIVATE KEY-----": "PRIVATE_KEY_REDACTED",
-        
-        # SSH keys
-        r"ssh-rsa [A-Za-z0-9+/=]+": "SSH_KEY_REDACTED",
-        r"ssh-ed25519 [A-Za-z0-9+/=]+": "SSH_KEY_REDACTED",
-        
-        # Environment variables with secrets
-        r"[A-Z_]+_SECRET\s*[:=]\s*['\"]?([A-Za-z0-9_-]{8,})['\"]?": "SECRET_REDACTED",
-        r"[A-Z_]+_PASSWORD\s*[:=]\s*['\"]?([A-Za-z0-9_-]{8,})['\"]?": "PASSWORD_REDACTED",
-        
-        # Credit card numbers
-        r"\b(?:\d{4}[-\s]?){3}\d{4}\b": "CREDIT_CARD_REDACTED",
-        
-        # Email addresses
-        r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b": "EMAIL_REDACTED",
-        
-        # Phone numbers
-        r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b": "PHONE_REDACTED",
-        
-        # IP addresses
-        r"\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b": "IP_REDACTED",
-        
-        # UUIDs
-        r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b": "UUID_REDACTED",
-        
-        # Platform-specific tokens
-        r"xox[baprs]-[0-9a-zA-Z-]+": "SLACK_TOKEN_REDACTED",
-        r"[MN][A-Za-z0-9]{23}\.[A-Za-z0-9_-]{6}\.[A-Za-z0-9_-]{27}": "DISCORD_TOKEN_REDACTED",
-        r"AIza[0-9A-Za-z-_]{35}": "GOOGLE_API_KEY_REDACTED",
-        r"EAA[0-9A-Za-z]+": "FACEBOOK_TOKEN_REDACTED",
-        r"[1-9][0-9]+-[0-9a-zA-Z]{40}": "TWITTER_TOKEN_REDACTED",
-    }
-    
-    for pattern, replacement in patterns.items():
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    # Patterns whose literal is absent cannot match, so their scan is skipped.
+    # Only ASCII text is checked this way: IGNORECASE also folds a few
+    # non-ASCII characters (such as the Kelvin sign) onto ASCII letters.
+    lowered = text.lower() if text.isascii() else None
+    for pattern, replacement, hint in _SECRET_PATTERNS:
+        if lowered is not None and hint is not None and hint not in lowered:
+            continue
+        text, count = pattern.subn(replacement, text)
+        if count and lowered is not None:
+            lowered = text.lower()
     
     return text
 
 
+# Tool patterns that would grant access to every tool
+_OVERLY_BROAD_TOOL_PATTERNS = frozenset({"*", "**", ".*"})
+
+_TOOL_PATTERN_RE = re.compile(r'^[a-zA-Z0-9_.*-]+$')
+
+
+# Agents in a collection tend to repeat the same handful of patterns
+@lru_cache(maxsize=2048)
 def validate_tool_pattern(pattern: str) -> tuple[bool, str]:
     """
     Validate a tool pattern for security issues.
@@ -170,7 +219,7 @@ def validate_tool_pattern(pattern: str) -> tuple[bool, str]:
         return False, "Tool pattern cannot be empty"
     
     # Check for overly broad patterns
-    if pattern in {"*", "**", ".*"}:
+    if pattern in _OVERLY_BROAD_TOOL_PATTERNS:
         return False, f"Overly broad tool pattern: {pattern}"
     
     # Check for suspicious patterns
@@ -178,7 +227,7 @@ def validate_tool_pattern(pattern: str) -> tuple[bool, str]:
         return False, f"Suspicious tool pattern: {pattern}"
     
     # Validate pattern format
-    if not re.match(r'^[a-zA-Z0-9_.*-]+$', pattern):
+    if not _TOOL_PATTERN_RE.match(pattern):
         return False, f"Tool pattern contains invalid characters: {pattern}"
     
     return True, ""
\ No newline at end of file
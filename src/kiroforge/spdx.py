@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-SPDX_LICENSES = {
+SPDX_LICENSES: frozenset[str] = frozenset({
     "MIT",
     "Apache-2.0",
     "BSD-2-Clause",
@@ -12,8 +12,9 @@ SPDX_LICENSES = {
     "MPL-2.0",
     "AGPL-3.0-only",
     "AGPL-3.0-or-later",
-}
+})
 
 
 def is_spdx_license(value: str) -> bool:
+    """Exact, case-sensitive identifier lookup; a frozenset hit needs no cache."""
     return value in SPDX_LICENSES
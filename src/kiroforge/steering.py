@@ -4,6 +4,15 @@ from dataclasses import dataclass
 from pathlib import Path
 import re
 
+# Content markers, each found with one early-exit scan of the content.
+# Headings start the content or follow any str.splitlines() boundary.
+_HEADING_RE = re.compile(r"(?:\A|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029])# ")
+_CONTEXT_RE = re.compile(r"because|why|reason")
+_SECRET_RE = re.compile(r"api key|password|secret|token")
+
+# Kebab-case (or dotted) lowercase name with an .md suffix
+_FILENAME_RE = re.compile(r"^[a-z0-9]+([-.][a-z0-9]+)*\.md$")
+
 
 @dataclass
 class SteeringIssue:
@@ -23,24 +32,27 @@ class SteeringValidationResult:
 def validate_steering(path: Path) -> SteeringValidationResult:
     issues: list[SteeringIssue] = []
 
-    if not path.exists():
+    # Read directly; a missing file is detected by the read itself. Reading
+    # bytes skips the text-layer wrapper, and utf-8-sig drops a leading BOM
+    # that would otherwise hide a heading on the first line.
+    try:
+        content = path.read_bytes().decode("utf-8-sig").strip()
+    except FileNotFoundError:
         issues.append(SteeringIssue("error", "Steering file not found"))
         return SteeringValidationResult(issues)
 
     if path.suffix.lower() != ".md":
         issues.append(SteeringIssue("warning", "Steering file should be .md"))
 
-    content = path.read_text(encoding="utf-8").strip()
     if not content:
         issues.append(SteeringIssue("error", "Steering file is empty"))
         return SteeringValidationResult(issues)
 
-    has_heading = any(line.startswith("# ") for line in content.splitlines())
-    if not has_heading:
+    if not _HEADING_RE.search(content):
         issues.append(SteeringIssue("warning", "Missing top-level heading (# ...)"))
 
     filename = path.name
-    if not re.match(r"^[a-z0-9]+([-.][a-z0-9]+)*\\.md$", filename):
+    if not _FILENAME_RE.match(filename):
         issues.append(
             SteeringIssue(
                 "warning",
@@ -49,7 +61,7 @@ def validate_steering(path: Path) -> SteeringValidationResult:
         )
 
     lowered = content.lower()
-    if not any(token in lowered for token in ["because", "why", "reason"]):
+    if not _CONTEXT_RE.search(lowered):
         issues.append(
             SteeringIssue(
                 "warning",
@@ -65,7 +77,7 @@ def validate_steering(path: Path) -> SteeringValidationResult:
             )
         )
 
-    if any(token in lowered for token in ["api key", "password", "secret", "token"]):
+    if _SECRET_RE.search(lowered):
         issues.append(
             SteeringIssue(
                 "error",
@@ -2,10 +2,46 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import os
 from pathlib import Path
-from typing import Dict, List
+import shutil
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping
 import importlib.resources
 
+import yaml
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Built-in templates shipped alongside the package sources
+_DEFAULT_TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates"
+
+
+def _fast_copytree(src: Path | str, dst: Path | str) -> None:
+    """Copy a template directory tree into ``dst``, merging with existing content.
+    
+    Unlike shutil.copytree, only file contents and executable permissions are
+    copied (no timestamps or other metadata); shutil.copyfile uses in-kernel
+    copies such as sendfile where the platform offers them. Symlinks are
+    followed, as with shutil.copytree's defaults.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _fast_copytree(entry.path, target)
+            else:
+                shutil.copyfile(entry.path, target)
+                if entry.stat().st_mode & 0o111:
+                    shutil.copymode(entry.path, target)
+
 
 class TemplateError(Exception):
     """Base exception for template-related errors."""
@@ -20,6 +56,8 @@ class TemplateNotFoundError(TemplateError):
 class TemplateManager:
     """Manages steering templates for KiroForge."""
     
+    __slots__ = ("templates_dir", "_yaml_cache", "_template_cache")
+    
     def __init__(self, templates_dir: Path | None = None):
         """Initialize template manager.
         
@@ -28,15 +66,16 @@ class TemplateManager:
         """
         if templates_dir is None:
             # Use package templates
-            try:
-                import kiroforge
-                package_root = Path(kiroforge.__file__).parent.parent.parent
-                self.templates_dir = package_root / "templates"
-            except (ImportError, AttributeError):
-                # Fallback to relative path
-                self.templates_dir = Path(__file__).parent.parent.parent / "templates"
+            self.templates_dir = _DEFAULT_TEMPLATES_DIR
         else:
             self.templates_dir = templates_dir
+        
+        # Parsed template YAML keyed by path, with the mtime (ns) it was read at
+        self._yaml_cache: Dict[Path, tuple[int, Any]] = {}
+        
+        # Template set contents keyed by set name, with the mtime (ns) of each
+        # file they were read from, keyed by filename
+        self._template_cache: Dict[str, tuple[Dict[str, int], Mapping[str, str]]] = {}
     
     def get_template_sets(self) -> List[str]:
         """Get available template sets.
@@ -44,43 +83,90 @@ class TemplateManager:
         Returns:
             List of template set names
         """
-        steering_dir = self.templates_dir / "steering"
-        if not steering_dir.exists():
+        # Names come straight from the directory listing; no Path per entry
+        try:
+            with os.scandir(self.templates_dir / "steering") as entries:
+                return [
+                    entry.name for entry in entries
+                    if not entry.name.startswith('.') and entry.is_dir()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        
-        return [
-            d.name for d in steering_dir.iterdir() 
-            if d.is_dir() and not d.name.startswith('.')
-        ]
     
-    def get_template_files(self, template_set: str) -> Dict[str, str]:
+    def get_template_files(self, template_set: str) -> Mapping[str, str]:
         """Get template files for a given set.
         
         Args:
             template_set: Name of the template set
             
         Returns:
-            Dictionary mapping filename to content
+            Read-only mapping of filename to content, shared with the cache;
+            use dict() on it for a mutable copy
             
+        Raises:
+            TemplateNotFoundError: If template set doesn't exist
+        """
+        set_dir = self._template_set_dir(template_set)
+        files = self._scan_template_files(set_dir)
+        
+        # Per-file mtimes also catch templates edited in place, which leave
+        # the directory mtime unchanged
+        try:
+            token = {entry.name: entry.stat().st_mtime_ns for entry in files}
+        except OSError as exc:
+            raise TemplateError(f"Cannot read template set {set_dir}: {exc}") from exc
+        cached = self._template_cache.get(template_set)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        
+        templates = {}
+        for entry in files:
+            templates[entry.name] = self._read_template(entry)
+        
+        frozen = MappingProxyType(templates)
+        self._template_cache[template_set] = (token, frozen)
+        return frozen
+    
+    def _template_set_dir(self, template_set: str) -> Path:
+        """Return the directory of a template set.
+        
         Raises:
             TemplateNotFoundError: If template set doesn't exist
         """
         set_dir = self.templates_dir / "steering" / template_set
-        if not set_dir.exists():
+        if not set_dir.is_dir():
             available = self.get_template_sets()
             raise TemplateNotFoundError(
                 f"Template set '{template_set}' not found. Available: {available}"
             )
+        return set_dir
+    
+    @staticmethod
+    def _scan_template_files(set_dir: Path) -> List[os.DirEntry[str]]:
+        """List the directory entries of the .md files in a template set.
         
-        templates = {}
-        for template_file in set_dir.glob("*.md"):
-            try:
-                content = template_file.read_text(encoding="utf-8")
-                templates[template_file.name] = content
-            except (OSError, UnicodeDecodeError) as exc:
-                raise TemplateError(f"Cannot read template {template_file}: {exc}") from exc
+        Uses os.scandir so file types come from the directory listing
+        instead of a stat() per entry. The entries cache their stat()
+        results, which on Windows come with the listing itself.
+        """
+        with os.scandir(set_dir) as entries:
+            return [
+                entry for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            ]
+    
+    @staticmethod
+    def _read_template(entry: os.DirEntry[str]) -> str:
+        """Read one template file as UTF-8 text.
         
-        return templates
+        Raises:
+            TemplateError: If the file cannot be read or decoded
+        """
+        try:
+            with open(entry.path, "r", encoding="utf-8") as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError) as exc:
+            raise TemplateError(f"Cannot read template {entry.path}: {exc}") from exc
     
     def get_template_content(self, template_set: str, filename: str) -> str:
         """Get content of a specific template file.
@@ -95,15 +181,29 @@ class TemplateManager:
         Raises:
             TemplateNotFoundError: If template or file doesn't exist
         """
-        templates = self.get_template_files(template_set)
-        if filename not in templates:
-            available = list(templates.keys())
-            raise TemplateNotFoundError(
-                f"Template file '{filename}' not found in set '{template_set}'. "
-                f"Available: {available}"
-            )
+        set_dir = self._template_set_dir(template_set)
+        files = self._scan_template_files(set_dir)
         
-        return templates[filename]
+        # Only the requested file is read; the listing decides membership so
+        # names match exactly as in get_template_files
+        for entry in files:
+            if entry.name == filename:
+                # Reuse the content get_template_files cached for this set
+                # while the file's mtime is unchanged
+                cached = self._template_cache.get(template_set)
+                if cached is not None and filename in cached[1]:
+                    try:
+                        if cached[0][filename] == entry.stat().st_mtime_ns:
+                            return cached[1][filename]
+                    except OSError:
+                        pass
+                return self._read_template(entry)
+        
+        available = [entry.name for entry in files]
+        raise TemplateNotFoundError(
+            f"Template file '{filename}' not found in set '{template_set}'. "
+            f"Available: {available}"
+        )
     
     def list_template_files(self, template_set: str) -> List[str]:
         """List available template files in a set.
@@ -114,51 +214,16 @@ class TemplateManager:
         Returns:
             List of template filenames
         """
-        templates = self.get_template_files(template_set)
-        return list(templates.keys())
-
-
-# Global template manager instance
-_template_manager = None
-
-
-def get_template_manager() -> TemplateManager:
-    """Get the global template manager instance."""
-    global _template_manager
-    if _template_manager is None:
-        _template_manager = TemplateManager()
-    return _template_manager
-
-
-def get_steering_templates(template_type: str) -> Dict[str, str]:
-    """Get steering templates for backward compatibility.
+        set_dir = self._template_set_dir(template_set)
+        return [entry.name for entry in self._scan_template_files(set_dir)]
     
-    Args:
-        template_type: Template set name (foundational, common, blank)
-        
-    Returns:
-        Dictionary mapping filename to content
-    """
-    manager = get_template_manager()
-    try:
-        return manager.get_template_files(template_type)
-    except TemplateNotFoundError:
-        # Fallback to empty templates for unknown sets
-        return {"steering.md": "# Steering\n\nAdd steering guidance here.\n"}
     def get_agent_templates(self) -> List[str]:
         """Get available agent templates.
         
         Returns:
             List of agent template names
         """
-        agents_dir = self.templates_dir / "agents"
-        if not agents_dir.exists():
-            return []
-        
-        return [
-            item.name for item in agents_dir.iterdir()
-            if item.is_dir() and (item / "agent.yaml").exists()
-        ]
+        return self._scan_template_dirs(self.templates_dir / "agents", "agent.yaml")
     
     def get_collection_templates(self) -> List[str]:
         """Get available collection templates.
@@ -166,14 +231,22 @@ def get_steering_templates(template_type: str) -> Dict[str, str]:
         Returns:
             List of collection template names
         """
-        collections_dir = self.templates_dir / "collections"
-        if not collections_dir.exists():
-            return []
+        return self._scan_template_dirs(self.templates_dir / "collections", "collection.yaml")
+    
+    @staticmethod
+    def _scan_template_dirs(parent: Path, marker: str) -> List[str]:
+        """List subdirectories of ``parent`` that contain a ``marker`` file.
         
-        return [
-            item.name for item in collections_dir.iterdir()
-            if item.is_dir() and (item / "collection.yaml").exists()
-        ]
+        Directory types come from os.scandir; only the marker check stats.
+        """
+        try:
+            with os.scandir(parent) as entries:
+                return [
+                    entry.name for entry in entries
+                    if entry.is_dir() and os.path.exists(os.path.join(entry.path, marker))
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
     
     def copy_agent_template(self, template_name: str, target_dir: Path) -> None:
         """Copy agent template to target directory.
@@ -192,7 +265,7 @@ def get_steering_templates(template_type: str) -> Dict[str, str]:
             raise TemplateNotFoundError(f"Agent template '{template_name}' not found. Available: {', '.join(available)}")
         
         try:
-            shutil.copytree(template_dir, target_dir, dirs_exist_ok=True)
+            _fast_copytree(template_dir, target_dir)
         except Exception as exc:
             raise TemplateError(f"Failed to copy agent template: {exc}")
     
@@ -213,7 +286,7 @@ def get_steering_templates(template_type: str) -> Dict[str, str]:
             raise TemplateNotFoundError(f"Collection template '{template_name}' not found. Available: {', '.join(available)}")
         
         try:
-            shutil.copytree(template_dir, target_dir, dirs_exist_ok=True)
+            _fast_copytree(template_dir, target_dir)
         except Exception as exc:
             raise TemplateError(f"Failed to copy collection template: {exc}")
     
@@ -230,25 +303,83 @@ def get_steering_templates(template_type: str) -> Dict[str, str]:
             TemplateNotFoundError: If template doesn't exist
         """
         template_dir = self.templates_dir / "agents" / template_name
-        if not template_dir.exists():
-            raise TemplateNotFoundError(f"Agent template '{template_name}' not found")
-        
         info = {"name": template_name, "description": "Agent template"}
         
-        # Try to read description from agent.yaml
-        agent_yaml = template_dir / "agent.yaml"
-        if agent_yaml.exists():
-            try:
-                import yaml
-                with agent_yaml.open("r") as f:
-                    data = yaml.safe_load(f)
-                    if "meta" in data and "description" in data["meta"]:
-                        info["description"] = data["meta"]["description"]
-            except Exception:
-                pass  # Use default description
+        # Try to read description from agent.yaml; only a missing file
+        # needs the extra check for whether the template itself exists
+        try:
+            data = self._load_template_yaml(template_dir / "agent.yaml")
+        except FileNotFoundError:
+            if not template_dir.exists():
+                raise TemplateNotFoundError(f"Agent template '{template_name}' not found") from None
+            return info
+        except Exception:
+            return info  # Use default description
+        
+        try:
+            if "meta" in data and "description" in data["meta"]:
+                info["description"] = data["meta"]["description"]
+        except Exception:
+            pass  # Use default description
         
         return info
     
+    def get_all_agent_template_infos(self) -> List[Dict[str, str]]:
+        """Get information about every agent template.
+        
+        Returns:
+            List of template information dictionaries, in template order
+        """
+        return self._collect_template_infos(
+            self.get_agent_templates(), self.get_agent_template_info, "Agent template"
+        )
+    
+    def get_all_collection_template_infos(self) -> List[Dict[str, str]]:
+        """Get information about every collection template.
+        
+        Returns:
+            List of template information dictionaries, in template order
+        """
+        return self._collect_template_infos(
+            self.get_collection_templates(), self.get_collection_template_info, "Collection template"
+        )
+    
+    @staticmethod
+    def _collect_template_infos(
+        names: List[str], get_info: Callable[[str], Dict[str, str]], default_description: str
+    ) -> List[Dict[str, str]]:
+        """Load template infos on a thread pool so their file reads overlap."""
+        def load(name: str) -> Dict[str, str]:
+            try:
+                return get_info(name)
+            except TemplateError:
+                # Template removed while listing; keep the default description
+                return {"name": name, "description": default_description}
+        
+        if not names:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+            return list(executor.map(load, names))
+    
+    def _load_template_yaml(self, path: Path) -> Any:
+        """Parse a template YAML file, reusing the result while it is unchanged.
+        
+        Args:
+            path: Path to the YAML file
+            
+        Returns:
+            Parsed YAML data
+        """
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._yaml_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        with path.open("rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+        self._yaml_cache[path] = (mtime_ns, data)
+        return data
+    
     def get_collection_template_info(self, template_name: str) -> Dict[str, str]:
         """Get information about a collection template.
         
@@ -262,21 +393,52 @@ def get_steering_templates(template_type: str) -> Dict[str, str]:
             TemplateNotFoundError: If template doesn't exist
         """
         template_dir = self.templates_dir / "collections" / template_name
-        if not template_dir.exists():
-            raise TemplateNotFoundError(f"Collection template '{template_name}' not found")
-        
         info = {"name": template_name, "description": "Collection template"}
         
-        # Try to read description from collection.yaml
-        collection_yaml = template_dir / "collection.yaml"
-        if collection_yaml.exists():
-            try:
-                import yaml
-                with collection_yaml.open("r") as f:
-                    data = yaml.safe_load(f)
-                    if "meta" in data and "description" in data["meta"]:
-                        info["description"] = data["meta"]["description"]
-            except Exception:
-                pass  # Use default description
-        
-        return info
\ No newline at end of file
+        # Try to read description from collection.yaml; only a missing file
+        # needs the extra check for whether the template itself exists
+        try:
+            data = self._load_template_yaml(template_dir / "collection.yaml")
+        except FileNotFoundError:
+            if not template_dir.exists():
+                raise TemplateNotFoundError(f"Collection template '{template_name}' not found") from None
+            return info
+        except Exception:
+            return info  # Use default description
+        
+        try:
+            if "meta" in data and "description" in data["meta"]:
+                info["description"] = data["meta"]["description"]
+        except Exception:
+            pass  # Use default description
+        
+        return info
+
+
+# Global template manager instance
+_template_manager = None
+
+
+def get_template_manager() -> TemplateManager:
+    """Get the global template manager instance."""
+    global _template_manager
+    if _template_manager is None:
+        _template_manager = TemplateManager()
+    return _template_manager
+
+
+def get_steering_templates(template_type: str) -> Mapping[str, str]:
+    """Get steering templates for backward compatibility.
+    
+    Args:
+        template_type: Template set name (foundational, common, blank)
+        
+    Returns:
+        Read-only mapping of filename to content
+    """
+    manager = get_template_manager()
+    try:
+        return manager.get_template_files(template_type)
+    except TemplateNotFoundError:
+        # Fallback to empty templates for unknown sets
+        return {"steering.md": "# Steering\n\nAdd steering guidance here.\n"}
@@ -1,33 +1,131 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import os
 from pathlib import Path
 import re
+from typing import Callable, Sequence
 
 from .parser import load_power_spec, PowerSpecError, PowerSpecFormatError, PowerSpecSizeError
-from .security import validate_file_path, validate_tool_pattern
-from .spdx import is_spdx_license
+from .security import validate_tool_pattern
 
+# Resource path count from which existence checks share directory listings
+_LISTING_MIN_PATHS = 8
 
-@dataclass
+# MAJOR.MINOR.PATCH; \Z (unlike $) also rejects a trailing newline, and
+# re.ASCII keeps \d to 0-9 rather than every Unicode decimal digit
+_SEMVER_RE = re.compile(r"\d+\.\d+\.\d+\Z", re.ASCII)
+
+# Issue message prefixes for the tests path: (outside power dir, missing path)
+_TESTS_PATH_PREFIXES = ("Tests path outside power directory: ", "Missing tests path: ")
+
+# PowerResources fields checked by validate_power, with their issue message
+# prefixes: (field, outside power dir, missing path)
+_RESOURCE_KINDS = (
+    ("steering_files", "Steering file path outside power directory: ", "Missing steering file: "),
+    ("tools_files", "Tools file path outside power directory: ", "Missing tools file: "),
+    ("hooks_files", "Hooks file path outside power directory: ", "Missing hooks file: "),
+    ("assets", "Asset path outside power directory: ", "Missing asset: "),
+)
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     level: str
     message: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
-    issues: list[ValidationIssue]
+    # Frozen, with issues stored as a tuple, so the ok computed at
+    # construction cannot go stale
+    issues: Sequence[ValidationIssue]
+    _ok: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "issues", tuple(self.issues))
+        object.__setattr__(self, "_ok", not any(issue.level == "error" for issue in self.issues))
 
     @property
     def ok(self) -> bool:
-        return not any(issue.level == "error" for issue in self.issues)
+        return self._ok
+
+
+@dataclass(frozen=True, slots=True)
+class CollectionValidationResult(ValidationResult):
+    # Results of the agents validated with the collection, keyed by agent
+    # path as written in collection.yaml; agents rejected before validation
+    # (outside the collection, missing directory) have no entry
+    agent_results: dict[str, ValidationResult] = field(default_factory=dict)
+
+
+def _listing_exists(base: Path) -> Callable[[str | os.PathLike[str]], bool]:
+    """Build an os.path.exists() for paths under ``base`` backed by directory listings.
+
+    Each parent directory is listed once with os.scandir; a path whose name
+    appears there as a non-symlink entry exists without a stat() of its own,
+    and nothing under a parent that does not exist can exist either. Anything
+    else (symlinks, "." or "..", trailing separators, unlistable parents,
+    names a case-insensitive filesystem would still match) falls back to
+    os.path.exists, so results are identical.
+    """
+    # parent -> {name: is_symlink}; False for a missing parent, None if unlistable
+    listings: dict[str, dict[str, bool] | bool | None] = {}
+
+    def exists(rel_path: str | os.PathLike[str]) -> bool:
+        full_path = os.path.join(base, rel_path)
+        parent, name = os.path.split(full_path)
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name: entry.is_symlink() for entry in entries}
+            except FileNotFoundError:
+                listings[parent] = False
+            except OSError:
+                listings[parent] = None
+        listing = listings[parent]
+        if listing is False:
+            return False
+        if listing is not None and listing.get(name) is False:
+            return True
+        return os.path.exists(full_path)
+
+    return exists
+
+
+def _check_within(root_real: str, rel_path: str | os.PathLike[str]) -> bool:
+    """Return whether ``rel_path`` resolves inside the already-resolved ``root_real``.
+
+    Same answer as security.validate_file_path(root, rel_path) for
+    ``root_real = os.path.realpath(root)``, without resolving the root again
+    for every path checked against it.
+    """
+    try:
+        target = os.path.normcase(os.path.realpath(os.path.join(root_real, rel_path)))
+    except (OSError, ValueError):
+        return False
+    root = os.path.normcase(root_real)
+    return target == root or target.startswith(os.path.join(root, ""))
+
+
+def _tool_pattern_issues(allowed_tools: list[str], denied_tools: list[str]) -> list[ValidationIssue]:
+    """Check allowed and denied tool patterns with the security module.
+
+    Each distinct pattern is checked (and reported) once, in order.
+    """
+    issues = []
+    for pattern in dict.fromkeys([*allowed_tools, *denied_tools]):
+        is_valid, error_msg = validate_tool_pattern(pattern)
+        if not is_valid:
+            issues.append(ValidationIssue("error" if "Suspicious" in error_msg else "warning", error_msg))
+    return issues
 
 
 def validate_power(power_dir: Path) -> ValidationResult:
     issues: list[ValidationIssue] = []
     spec_path = power_dir / "POWER.md"
-    if not spec_path.exists():
+    if not os.path.exists(spec_path):
         issues.append(ValidationIssue("error", "Missing POWER.md"))
         return ValidationResult(issues)
 
@@ -49,7 +147,7 @@ def validate_power(power_dir: Path) -> ValidationResult:
         issues.append(ValidationIssue("error", f"Power specification error: {exc}"))
         return ValidationResult(issues)
 
-    if not re.match(r"^\d+\.\d+\.\d+$", spec.meta.version):
+    if not _SEMVER_RE.match(spec.meta.version):
         issues.append(
             ValidationIssue(
                 "error",
@@ -57,76 +155,48 @@ def validate_power(power_dir: Path) -> ValidationResult:
             )
         )
 
-    if spec.meta.license and not is_spdx_license(spec.meta.license):
-        issues.append(
-            ValidationIssue(
-                "warning",
-                f"License is not a known SPDX identifier: {spec.meta.license}",
-            )
-        )
+    # Quoted YAML values may carry padding; "  MIT " is still MIT
+    license_id = spec.meta.license.strip() if spec.meta.license else ""
+    if license_id:
+        # Only specs that declare a license need the SPDX table
+        from .spdx import is_spdx_license
 
-    # Security: Validate test path for path traversal
-    if spec.tests.tests_path:
-        if not validate_file_path(power_dir, spec.tests.tests_path):
-            issues.append(ValidationIssue(
-                "error", 
-                f"Tests path outside power directory: {spec.tests.tests_path}"
-            ))
-        elif not (power_dir / spec.tests.tests_path).exists():
+        if not is_spdx_license(license_id):
             issues.append(
-                ValidationIssue("error", f"Missing tests path: {spec.tests.tests_path}")
+                ValidationIssue(
+                    "warning",
+                    f"License is not a known SPDX identifier: {spec.meta.license}",
+                )
             )
 
-    # Security: Validate all resource file paths for path traversal
-    for rel_path in spec.resources.steering_files:
-        if not validate_file_path(power_dir, rel_path):
-            issues.append(ValidationIssue(
-                "error", 
-                f"Steering file path outside power directory: {rel_path}"
-            ))
-        elif not (power_dir / rel_path).exists():
-            issues.append(ValidationIssue("error", f"Missing steering file: {rel_path}"))
-
-    for rel_path in spec.resources.tools_files:
-        if not validate_file_path(power_dir, rel_path):
-            issues.append(ValidationIssue(
-                "error", 
-                f"Tools file path outside power directory: {rel_path}"
-            ))
-        elif not (power_dir / rel_path).exists():
-            issues.append(ValidationIssue("error", f"Missing tools file: {rel_path}"))
-
-    for rel_path in spec.resources.hooks_files:
-        if not validate_file_path(power_dir, rel_path):
-            issues.append(ValidationIssue(
-                "error", 
-                f"Hooks file path outside power directory: {rel_path}"
-            ))
-        elif not (power_dir / rel_path).exists():
-            issues.append(ValidationIssue("error", f"Missing hooks file: {rel_path}"))
-
-    for rel_path in spec.resources.assets:
-        if not validate_file_path(power_dir, rel_path):
-            issues.append(ValidationIssue(
-                "error", 
-                f"Asset path outside power directory: {rel_path}"
-            ))
-        elif not (power_dir / rel_path).exists():
-            issues.append(ValidationIssue("error", f"Missing asset: {rel_path}"))
+    # Security: Validate the test path and all resource file paths for path traversal
+    root_real = os.path.realpath(power_dir)
+    tests_path = spec.tests.tests_path
+    resource_groups = [([tests_path] if tests_path else [], *_TESTS_PATH_PREFIXES)]
+    resource_groups += [
+        (getattr(spec.resources, field), outside_prefix, missing_prefix)
+        for field, outside_prefix, missing_prefix in _RESOURCE_KINDS
+    ]
+    # Existence follows symlinks (exists, not lexists): a dangling link is
+    # as unreadable as a missing file and is reported the same way
+    if sum(len(rel_paths) for rel_paths, _, _ in resource_groups) >= _LISTING_MIN_PATHS:
+        exists = _listing_exists(power_dir)
+    else:
+        exists = lambda rel_path: os.path.exists(os.path.join(power_dir, rel_path))
+    for rel_paths, outside_prefix, missing_prefix in resource_groups:
+        for rel_path in rel_paths:
+            rel = os.fspath(rel_path)
+            if not _check_within(root_real, rel_path):
+                issues.append(ValidationIssue("error", outside_prefix + rel))
+            elif not exists(rel_path):
+                issues.append(ValidationIssue("error", missing_prefix + rel))
 
     # Security: Validate tool patterns using centralized security module
-    for pattern in spec.constraints.allowed_tools:
-        is_valid, error_msg = validate_tool_pattern(pattern)
-        if not is_valid:
-            issues.append(ValidationIssue("error" if "Suspicious" in error_msg else "warning", error_msg))
-    
-    for pattern in spec.constraints.denied_tools:
-        is_valid, error_msg = validate_tool_pattern(pattern)
-        if not is_valid:
-            issues.append(ValidationIssue("error" if "Suspicious" in error_msg else "warning", error_msg))
+    allowed_tools = spec.constraints.allowed_tools
+    denied_tools = spec.constraints.denied_tools
+    issues.extend(_tool_pattern_issues(allowed_tools, denied_tools))
 
-    overlap = set(spec.constraints.allowed_tools) & set(spec.constraints.denied_tools)
-    if overlap:
+    if not set(allowed_tools).isdisjoint(denied_tools):
         issues.append(
             ValidationIssue(
                 "warning",
@@ -140,7 +210,6 @@ def validate_power(power_dir: Path) -> ValidationResult:
 
 from .parser import load_agent_spec, load_collection_spec, AgentSpecError, CollectionSpecError, normalize_power_reference
 from .models import AgentSpec, CollectionSpec, DelegationSecurity
-import yaml
 
 
 def validate_agent(agent_dir: Path) -> ValidationResult:
@@ -149,14 +218,35 @@ def validate_agent(agent_dir: Path) -> ValidationResult:
     Args:
         agent_dir: Path to agent directory
         
+    Returns:
+        ValidationResult: Validation results with issues
+    """
+    return _validate_agent(agent_dir, {})
+
+
+def _validate_agent(
+    agent_dir: Path,
+    power_results: dict[str, ValidationResult],
+    registered_agents: set[str] | None = None,
+) -> ValidationResult:
+    """Validate an agent directory, sharing power results with the caller.
+    
+    Args:
+        agent_dir: Path to agent directory
+        power_results: Power validation results keyed by resolved power path
+        registered_agents: Agent names registered in the enclosing collection,
+            if the caller has already parsed its collection.yaml
+        
     Returns:
         ValidationResult: Validation results with issues
     """
     issues: list[ValidationIssue] = []
     
+    # agent.yaml, the prompt file and the test path usually share one listing
+    exists = _listing_exists(agent_dir)
+    
     # Check agent.yaml exists
-    agent_yaml = agent_dir / "agent.yaml"
-    if not agent_yaml.exists():
+    if not exists("agent.yaml"):
         issues.append(ValidationIssue("error", "Missing agent.yaml"))
         return ValidationResult(issues)
     
@@ -172,137 +262,156 @@ def validate_agent(agent_dir: Path) -> ValidationResult:
         issues.append(ValidationIssue("error", f"Cannot read agent files: {exc}"))
         return ValidationResult(issues)
     
+    agent_real = os.path.realpath(agent_dir)
+    
     # Validate system prompt file exists
-    prompt_file = agent_dir / spec.identity.prompt_file
-    if not prompt_file.exists():
+    if not exists(spec.identity.prompt_file):
         issues.append(ValidationIssue("error", f"Missing system prompt file: {spec.identity.prompt_file}"))
-    elif not validate_file_path(agent_dir, Path(spec.identity.prompt_file)):
+    elif not _check_within(agent_real, spec.identity.prompt_file):
         issues.append(ValidationIssue("error", f"System prompt file path outside agent directory: {spec.identity.prompt_file}"))
     
     # Validate power dependencies
     for power_ref in spec.powers:
         power_data = normalize_power_reference(power_ref)
         power_path = power_data["path"]
-        power_dir = agent_dir / power_path
         
-        if not validate_file_path(agent_dir, Path(power_path)):
+        if not _check_within(agent_real, power_path):
             issues.append(ValidationIssue("error", f"Power path outside agent directory: {power_path}"))
             continue
             
-        if not power_dir.exists():
+        if not exists(power_path):
             issues.append(ValidationIssue("error", f"Missing power directory: {power_path}"))
             continue
         
         # Validate power using existing power validator
-        power_result = validate_power(power_dir)
+        power_result = _validate_power_cached(agent_dir / power_path, power_results)
         if not power_result.ok:
-            for issue in power_result.issues:
-                issues.append(ValidationIssue(issue.level, f"Power {power_path}: {issue.message}"))
+            _extend_prefixed(issues, f"Power {power_path}: ", power_result)
     
     # Validate delegation security
     if spec.subagents:
         issues.extend(_validate_delegation_security(spec.subagents.delegation_security))
-        issues.extend(_validate_subagent_resolution(agent_dir, spec.subagents.allowed_specialists))
+        issues.extend(_validate_subagent_resolution(
+            agent_dir, spec.subagents.allowed_specialists, registered_agents
+        ))
     
     # Validate constraints
     issues.extend(_validate_agent_constraints(spec.constraints))
     
     # Validate test path
     if spec.tests.test_path:
-        test_path = agent_dir / spec.tests.test_path
-        if not validate_file_path(agent_dir, Path(spec.tests.test_path)):
+        if not _check_within(agent_real, spec.tests.test_path):
             issues.append(ValidationIssue("error", f"Test path outside agent directory: {spec.tests.test_path}"))
-        elif not test_path.exists():
+        elif not exists(spec.tests.test_path):
             issues.append(ValidationIssue("warning", f"Test directory does not exist: {spec.tests.test_path}"))
     
     return ValidationResult(issues)
 
 
-def validate_collection(collection_dir: Path) -> ValidationResult:
+def validate_collection(collection_dir: Path) -> CollectionValidationResult:
     """Validate a collection directory and all its agents.
     
     Args:
         collection_dir: Path to collection directory
         
     Returns:
-        ValidationResult: Validation results with issues
+        CollectionValidationResult: Validation results with issues, and the
+        result of each agent validated along the way
     """
     issues: list[ValidationIssue] = []
     
     # Check collection.yaml exists
-    collection_yaml = collection_dir / "collection.yaml"
-    if not collection_yaml.exists():
+    if not os.path.exists(os.path.join(collection_dir, "collection.yaml")):
         issues.append(ValidationIssue("error", "Missing collection.yaml"))
-        return ValidationResult(issues)
+        return CollectionValidationResult(issues)
     
     try:
         spec = load_collection_spec(collection_dir)
     except CollectionSpecError as exc:
         issues.append(ValidationIssue("error", f"Collection specification error: {exc}"))
-        return ValidationResult(issues)
+        return CollectionValidationResult(issues)
     except FileNotFoundError as exc:
         issues.append(ValidationIssue("error", f"Collection file not found: {exc}"))
-        return ValidationResult(issues)
+        return CollectionValidationResult(issues)
     except PermissionError as exc:
         issues.append(ValidationIssue("error", f"Cannot read collection files: {exc}"))
-        return ValidationResult(issues)
+        return CollectionValidationResult(issues)
+    
+    collection_real = os.path.realpath(collection_dir)
+    
+    # Powers shared between agents are validated once per collection
+    power_results: dict[str, ValidationResult] = {}
     
     # Validate shared powers
     for power_path in spec.shared_context.powers:
-        power_dir = collection_dir / power_path
-        if not validate_file_path(collection_dir, Path(power_path)):
+        if not _check_within(collection_real, power_path):
             issues.append(ValidationIssue("error", f"Shared power path outside collection directory: {power_path}"))
             continue
             
-        if not power_dir.exists():
+        if not os.path.exists(os.path.join(collection_dir, power_path)):
             issues.append(ValidationIssue("error", f"Missing shared power directory: {power_path}"))
             continue
         
         # Validate shared power
-        power_result = validate_power(power_dir)
+        power_result = _validate_power_cached(collection_dir / power_path, power_results)
         if not power_result.ok:
-            for issue in power_result.issues:
-                issues.append(ValidationIssue(issue.level, f"Shared power {power_path}: {issue.message}"))
+            _extend_prefixed(issues, f"Shared power {power_path}: ", power_result)
     
     # Validate shared steering files
     for steering_path in spec.shared_context.steering:
-        steering_file = collection_dir / steering_path
-        if not validate_file_path(collection_dir, Path(steering_path)):
+        if not _check_within(collection_real, steering_path):
             issues.append(ValidationIssue("error", f"Shared steering file path outside collection directory: {steering_path}"))
-        elif not steering_file.exists():
+        elif not os.path.exists(os.path.join(collection_dir, steering_path)):
             issues.append(ValidationIssue("error", f"Missing shared steering file: {steering_path}"))
     
-    # Validate all referenced agents
+    # Agents directly under agents/ resolve subagents against this registry
+    registered_agents = {Path(agent_ref.path).name for agent_ref in spec.agents}
+    
+    # Validate all referenced agents. Path and name checks run in order here;
+    # the agents themselves are validated on a thread pool so their file reads
+    # overlap, and their issues are merged back in collection order.
     agent_names = set()
-    for agent_ref in spec.agents:
-        agent_path = collection_dir / agent_ref.path
-        agent_name = Path(agent_ref.path).name
-        
-        if not validate_file_path(collection_dir, Path(agent_ref.path)):
-            issues.append(ValidationIssue("error", f"Agent path outside collection directory: {agent_ref.path}"))
-            continue
+    pending: list[ValidationIssue | tuple[str, Future[ValidationResult]]] = []
+    with ThreadPoolExecutor(max_workers=min(8, len(spec.agents))) as executor:
+        for agent_ref in spec.agents:
+            agent_name = Path(agent_ref.path).name
+            
+            if not _check_within(collection_real, agent_ref.path):
+                pending.append(ValidationIssue("error", f"Agent path outside collection directory: {agent_ref.path}"))
+                continue
+                
+            if not os.path.exists(os.path.join(collection_dir, agent_ref.path)):
+                pending.append(ValidationIssue("error", f"Missing agent directory: {agent_ref.path}"))
+                continue
+            
+            # Check for duplicate agent names
+            if agent_name in agent_names:
+                pending.append(ValidationIssue("error", f"Duplicate agent name: {agent_name}"))
+            agent_names.add(agent_name)
             
-        if not agent_path.exists():
-            issues.append(ValidationIssue("error", f"Missing agent directory: {agent_ref.path}"))
+            # Validate individual agent
+            agent_path = collection_dir / agent_ref.path
+            in_registry_dir = agent_path.parent.parent == collection_dir
+            pending.append((agent_ref.path, executor.submit(
+                _validate_agent, agent_path, power_results, registered_agents if in_registry_dir else None
+            )))
+    
+    agent_results: dict[str, ValidationResult] = {}
+    for item in pending:
+        if isinstance(item, ValidationIssue):
+            issues.append(item)
             continue
-        
-        # Check for duplicate agent names
-        if agent_name in agent_names:
-            issues.append(ValidationIssue("error", f"Duplicate agent name: {agent_name}"))
-        agent_names.add(agent_name)
-        
-        # Validate individual agent
-        agent_result = validate_agent(agent_path)
+        agent_path, future = item
+        agent_result = agent_results[agent_path] = future.result()
         if not agent_result.ok:
-            for issue in agent_result.issues:
-                issues.append(ValidationIssue(issue.level, f"Agent {agent_name}: {issue.message}"))
+            _extend_prefixed(issues, f"Agent {Path(agent_path).name}: ", agent_result)
     
     # Validate coordination patterns reference valid roles
     if spec.coordination:
         valid_roles = {agent.role for agent in spec.agents}
         for pattern in spec.coordination.patterns:
-            if " -> " in pattern:
-                _, target = pattern.split(" -> ", 1)
+            _, arrow, target = pattern.partition(" -> ")
+            if arrow:
                 target = target.strip()
                 if target not in valid_roles and "spawns subagents" not in target:
                     issues.append(ValidationIssue("warning", f"Coordination pattern references unknown role: {target}"))
@@ -311,7 +420,38 @@ def validate_collection(collection_dir: Path) -> ValidationResult:
     if spec.shared_context.constraints:
         issues.extend(_validate_agent_constraints(spec.shared_context.constraints))
     
-    return ValidationResult(issues)
+    return CollectionValidationResult(issues, agent_results=agent_results)
+
+
+def _validate_power_cached(power_dir: Path, power_results: dict[str, ValidationResult]) -> ValidationResult:
+    """Validate a power directory once per resolved path.
+    
+    Safe to call from several threads: dict reads and writes are atomic, and
+    two threads racing on the same power just store equal results.
+    
+    Args:
+        power_dir: Path to power directory
+        power_results: Power validation results keyed by resolved power path
+        
+    Returns:
+        ValidationResult: Validation results with issues (shared, do not modify)
+    """
+    key = os.path.realpath(power_dir)
+    result = power_results.get(key)
+    if result is None:
+        result = power_results[key] = validate_power(power_dir)
+    return result
+
+
+def _extend_prefixed(issues: list[ValidationIssue], prefix: str, result: ValidationResult) -> None:
+    """Append a nested result's issues, with ``prefix`` on each message.
+    
+    Args:
+        issues: Issue list to extend
+        prefix: Text naming where the nested issues come from
+        result: Nested validation result
+    """
+    issues.extend(ValidationIssue(issue.level, prefix + issue.message) for issue in result.issues)
 
 
 def _validate_delegation_security(security: DelegationSecurity) -> list[ValidationIssue]:
@@ -362,12 +502,18 @@ def _validate_delegation_security(security: DelegationSecurity) -> list[Validati
     return issues
 
 
-def _validate_subagent_resolution(agent_dir: Path, specialists: list[str]) -> list[ValidationIssue]:
+def _validate_subagent_resolution(
+    agent_dir: Path,
+    specialists: list[str],
+    registered_agents: set[str] | None = None,
+) -> list[ValidationIssue]:
     """Validate subagent specialist resolution.
     
     Args:
         agent_dir: Path to agent directory
         specialists: List of specialist names to validate
+        registered_agents: Agent names from the collection.yaml two levels up,
+            if already known; otherwise that file is read when present
         
     Returns:
         list[ValidationIssue]: List of validation issues
@@ -376,7 +522,10 @@ def _validate_subagent_resolution(agent_dir: Path, specialists: list[str]) -> li
     
     # Check if in collection context
     collection_yaml = agent_dir.parent.parent / "collection.yaml"
-    if collection_yaml.exists():
+    if registered_agents is not None:
+        # Collection context, registry already parsed by validate_collection
+        issues.extend(_validate_registered_subagents(registered_agents, specialists))
+    elif collection_yaml.exists():
         # Collection context: validate against collection registry
         issues.extend(_validate_collection_subagents(collection_yaml, specialists))
     else:
@@ -396,22 +545,22 @@ def _validate_standalone_subagents(agent_dir: Path, specialists: list[str]) -> l
     Returns:
         list[ValidationIssue]: List of validation issues
     """
+    if not specialists:
+        return []
+    
     issues = []
     agents_dir = agent_dir.parent
-    available_agents = []
-    
-    # Find available sibling agents
-    if agents_dir.exists():
-        for item in agents_dir.iterdir():
-            if item.is_dir() and item != agent_dir and (item / "agent.yaml").exists():
-                available_agents.append(item.name)
+    # Sibling agents are listed only when a specialist is missing
+    available_str: str | None = None
     
     for specialist in specialists:
         specialist_dir = agents_dir / specialist
         if not specialist_dir.exists():
+            if available_str is None:
+                available_str = ', '.join(sorted(_list_sibling_agents(agent_dir)))
             issues.append(ValidationIssue(
                 "error",
-                f"Sibling agent '{specialist}' not found at {specialist_dir.relative_to(agent_dir.parent.parent)}. Available: {', '.join(sorted(available_agents))}"
+                f"Sibling agent '{specialist}' not found at {specialist_dir.relative_to(agent_dir.parent.parent)}. Available: {available_str}"
             ))
         elif not (specialist_dir / "agent.yaml").exists():
             issues.append(ValidationIssue(
@@ -422,6 +571,26 @@ def _validate_standalone_subagents(agent_dir: Path, specialists: list[str]) -> l
     return issues
 
 
+def _list_sibling_agents(agent_dir: Path) -> list[str]:
+    """List the names of sibling agent directories that contain agent.yaml.
+    
+    Args:
+        agent_dir: Path to agent directory
+        
+    Returns:
+        list[str]: Sibling agent names, excluding agent_dir itself
+    """
+    agents_dir = agent_dir.parent
+    available_agents = []
+    
+    if agents_dir.exists():
+        for item in agents_dir.iterdir():
+            if item.is_dir() and item != agent_dir and (item / "agent.yaml").exists():
+                available_agents.append(item.name)
+    
+    return available_agents
+
+
 def _validate_collection_subagents(collection_yaml: Path, specialists: list[str]) -> list[ValidationIssue]:
     """Validate subagents in collection context.
     
@@ -432,11 +601,15 @@ def _validate_collection_subagents(collection_yaml: Path, specialists: list[str]
     Returns:
         list[ValidationIssue]: List of validation issues
     """
+    import yaml
+
+    from .parser import _SafeLoader
+
     issues = []
     
     try:
         with collection_yaml.open("r") as f:
-            collection_data = yaml.safe_load(f)
+            collection_data = yaml.load(f, Loader=_SafeLoader)
         
         # Extract agent names from collection registry
         registered_agents = set()
@@ -445,12 +618,7 @@ def _validate_collection_subagents(collection_yaml: Path, specialists: list[str]
             agent_name = agent_path.name
             registered_agents.add(agent_name)
         
-        for specialist in specialists:
-            if specialist not in registered_agents:
-                issues.append(ValidationIssue(
-                    "error",
-                    f"Agent '{specialist}' not found in collection registry. Available: {', '.join(sorted(registered_agents))}"
-                ))
+        issues.extend(_validate_registered_subagents(registered_agents, specialists))
     
     except Exception as exc:
         issues.append(ValidationIssue("error", f"Failed to validate collection registry: {exc}"))
@@ -458,6 +626,31 @@ def _validate_collection_subagents(collection_yaml: Path, specialists: list[str]
     return issues
 
 
+def _validate_registered_subagents(registered_agents: set[str], specialists: list[str]) -> list[ValidationIssue]:
+    """Validate subagents against the agent names registered in a collection.
+    
+    Args:
+        registered_agents: Agent names registered in the collection
+        specialists: List of specialist names
+        
+    Returns:
+        list[ValidationIssue]: List of validation issues
+    """
+    issues = []
+    available_str: str | None = None
+    
+    for specialist in specialists:
+        if specialist not in registered_agents:
+            if available_str is None:
+                available_str = ', '.join(sorted(registered_agents))
+            issues.append(ValidationIssue(
+                "error",
+                f"Agent '{specialist}' not found in collection registry. Available: {available_str}"
+            ))
+    
+    return issues
+
+
 def _validate_agent_constraints(constraints: 'AgentConstraints') -> list[ValidationIssue]:
     """Validate agent constraints.
     
@@ -467,21 +660,12 @@ def _validate_agent_constraints(constraints: 'AgentConstraints') -> list[Validat
     Returns:
         list[ValidationIssue]: List of validation issues
     """
-    issues = []
-    
     # Validate tool patterns using existing security module
-    for pattern in constraints.allowed_tools:
-        is_valid, error_msg = validate_tool_pattern(pattern)
-        if not is_valid:
-            issues.append(ValidationIssue("error" if "Suspicious" in error_msg else "warning", error_msg))
-    
-    for pattern in constraints.denied_tools:
-        is_valid, error_msg = validate_tool_pattern(pattern)
-        if not is_valid:
-            issues.append(ValidationIssue("error" if "Suspicious" in error_msg else "warning", error_msg))
+    issues = _tool_pattern_issues(constraints.allowed_tools, constraints.denied_tools)
     
-    # Check for overlapping patterns
-    overlap = set(constraints.allowed_tools) & set(constraints.denied_tools)
+    # Check for overlapping patterns, reported in allowed_tools order
+    denied = frozenset(constraints.denied_tools)
+    overlap = [pattern for pattern in dict.fromkeys(constraints.allowed_tools) if pattern in denied]
     if overlap:
         issues.append(ValidationIssue(
             "warning",
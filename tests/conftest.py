@@ -0,0 +1,86 @@
+"""Shared fixtures for the KiroForge test suite."""
+
+from pathlib import Path
+import re
+import shutil
+import subprocess
+import tempfile
+
+import pytest
+from typer.testing import CliRunner
+
+from kiroforge.validator import ValidationResult, validate_power
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Also run tests marked slow (kiro-cli and subprocess heavy)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """CLI test runner, shared by the whole session."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def tmp_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One scratch directory for the session; tests mint subdirectories in it."""
+    return tmp_path_factory.mktemp("kf")
+
+
+@pytest.fixture
+def test_dir(tmp_root: Path, request: pytest.FixtureRequest) -> Path:
+    """Fresh per-test directory under the session scratch root."""
+    # Test names repeat across modules and classes, and parametrize ids may
+    # contain path characters, so the name is only a readable prefix and
+    # mkdtemp guarantees the directory is unique
+    prefix = re.sub(r"[^\w.-]", "_", request.node.name)[:40]
+    return Path(tempfile.mkdtemp(prefix=f"{prefix}-", dir=tmp_root))
+
+
+@pytest.fixture(scope="session")
+def example_powers() -> Path:
+    """Directory holding the example powers shipped with the repo."""
+    return Path(__file__).parents[1] / "examples" / "kiro_powers"
+
+
+@pytest.fixture(scope="session")
+def validated_examples(example_powers: Path) -> dict[str, ValidationResult]:
+    """Validation results for the example powers, computed once per session."""
+    return {
+        power_dir.name: validate_power(power_dir)
+        for power_dir in sorted(example_powers.iterdir())
+        if power_dir.is_dir()
+    }
+
+
+@pytest.fixture(scope="session")
+def kiro_version() -> subprocess.CompletedProcess[str]:
+    """Result of a single `kiro-cli --version` run, shared by the session."""
+    if not shutil.which("kiro-cli"):
+        pytest.skip("kiro-cli not available")
+    try:
+        return subprocess.run(
+            ["kiro-cli", "--version"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except subprocess.TimeoutExpired:
+        pytest.skip("kiro-cli command timed out")
+    except FileNotFoundError:
+        pytest.skip("kiro-cli not found in PATH")
@@ -1,36 +1,35 @@
 """Integration tests for KiroForge with real kiro-cli interaction."""
 
-import subprocess
-import tempfile
-from pathlib import Path
+import os
 import pytest
 import shutil
 
 from kiroforge.cli import app
+from kiroforge.config import RouterConfig
 from kiroforge.parser import load_power_spec
+from kiroforge.router import select_powers
 from kiroforge.validator import validate_power
-from typer.testing import CliRunner
 
+# Looked up once at import rather than per skip condition
+HAS_KIRO = shutil.which("kiro-cli") is not None
 
-@pytest.fixture
-def runner():
-    """CLI test runner."""
-    return CliRunner()
 
-
-@pytest.fixture
-def temp_power_dir():
-    """Create a temporary power directory for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        power_dir = Path(temp_dir) / "test-power"
-        power_dir.mkdir()
-        yield power_dir
+@pytest.fixture(scope="module")
+def example_specs(example_powers):
+    """Parsed specs of the example powers."""
+    return [
+        load_power_spec(power_dir / "POWER.md")
+        for power_dir in sorted(example_powers.iterdir())
+        if (power_dir / "POWER.md").exists()
+    ]
 
 
 @pytest.fixture
-def kiro_cli_available():
-    """Check if kiro-cli is available for integration tests."""
-    return shutil.which("kiro-cli") is not None
+def temp_power_dir(test_dir):
+    """Create a temporary power directory for testing."""
+    power_dir = test_dir / "test-power"
+    power_dir.mkdir()
+    return power_dir
 
 
 class TestCLIIntegration:
@@ -52,44 +51,70 @@ class TestCLIIntegration:
             "tests/tests.yaml"
         ]
         
-        for file_path in expected_files:
-            assert (temp_power_dir / file_path).exists(), f"Missing {file_path}"
+        present = {
+            path.relative_to(temp_power_dir).as_posix()
+            for path in temp_power_dir.rglob("*")
+            if path.is_file()
+        }
+        missing = set(expected_files) - present
+        assert not missing, f"Missing {sorted(missing)}"
         
         # Verify the power validates
         validation_result = validate_power(temp_power_dir)
         assert validation_result.ok, f"Validation failed: {[i.message for i in validation_result.issues]}"
     
-    def test_validate_command(self, runner):
-        """Test validate command on example powers."""
-        # Test demo power validation
-        result = runner.invoke(app, ["validate", "examples/kiro_powers/demo-power"])
-        assert result.exit_code == 0
-        assert "OK" in result.stdout
+    def test_route_with_improved_matching(self, example_specs):
+        """Test routing with improved matching algorithms."""
+        # A prompt naming the demo power should rank it first
+        matches = select_powers(example_specs, "run demo power validation")
+        assert matches
+        assert matches[0].name == "demo-power"
+    
+    def test_route_with_configuration(self, example_specs):
+        """Test routing respects router configuration."""
+        config = RouterConfig(min_score=5, max_results=2)
+        matches = select_powers(
+            example_specs,
+            "test prompt",
+            min_score=config.min_score,
+            max_results=config.max_results,
+        )
         
-        # Test mcp-hook power validation  
-        result = runner.invoke(app, ["validate", "examples/kiro_powers/mcp-hook-power"])
-        assert result.exit_code == 0
-        assert "OK" in result.stdout
+        assert len(matches) <= config.max_results
+        assert all(match.score >= config.min_score for match in matches)
     
-    def test_route_command_with_improved_matching(self, runner):
-        """Test route command with improved matching algorithms."""
-        # Test with a prompt that should match demo power
+    def test_init_steering_generate_mode(self, runner, test_dir):
+        """Test steering generation in generate mode."""
+        steering_dir = test_dir / ".kiro" / "steering"
+        
         result = runner.invoke(app, [
-            "route", 
-            "run demo power validation",
-            "--powers-dir", "examples/kiro_powers"
+            "init-steering",
+            str(steering_dir),
+            "--mode", "generate",
+            "--template", "foundational",
+            "--file", "product.md"
         ])
         
         assert result.exit_code == 0
-        # Should find matches with improved router
-        assert "demo-power" in result.stdout or "No matching powers found" in result.stdout
+        assert "Created steering files" in result.stdout
+        assert "product.md" in os.listdir(steering_dir)
+
+
+class TestCLISmoke:
+    """One CLI invocation per command, covering argument parsing and output."""
+    
+    def test_validate_command(self, runner, example_powers):
+        """Test validate command on an example power."""
+        result = runner.invoke(app, ["validate", str(example_powers / "demo-power")])
+        assert result.exit_code == 0
+        assert "OK" in result.stdout
     
-    def test_route_command_with_configuration(self, runner):
-        """Test route command respects configuration."""
+    def test_route_command(self, runner, example_powers):
+        """Test route command reports the effective configuration."""
         result = runner.invoke(app, [
             "route",
             "test prompt", 
-            "--powers-dir", "examples/kiro_powers",
+            "--powers-dir", str(example_powers),
             "--min-score", "5",
             "--max-results", "2"
         ])
@@ -105,26 +130,10 @@ class TestCLIIntegration:
         assert ("kiro-cli found" in result.stdout or 
                 "kiro-cli not found" in result.stdout)
     
-    def test_init_steering_generate_mode(self, runner):
-        """Test steering generation in generate mode."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            steering_dir = Path(temp_dir) / ".kiro" / "steering"
-            
-            result = runner.invoke(app, [
-                "init-steering",
-                str(steering_dir),
-                "--mode", "generate",
-                "--template", "foundational",
-                "--file", "product.md"
-            ])
-            
-            assert result.exit_code == 0
-            assert "Created steering files" in result.stdout
-            assert (steering_dir / "product.md").exists()
-    
-    def test_run_tests_command(self, runner):
+    @pytest.mark.slow
+    def test_run_tests_command(self, runner, example_powers):
         """Test run-tests command on example powers."""
-        result = runner.invoke(app, ["run-tests", "examples/kiro_powers/demo-power"])
+        result = runner.invoke(app, ["run-tests", str(example_powers / "demo-power")])
         
         # Should either pass or show specific test results
         assert result.exit_code in [0, 1]  # 0 for pass, 1 for fail
@@ -134,48 +143,37 @@ class TestCLIIntegration:
 class TestKiroCliIntegration:
     """Test integration with actual kiro-cli if available."""
     
-    @pytest.mark.skipif(not shutil.which("kiro-cli"), reason="kiro-cli not available")
-    def test_kiro_cli_basic_functionality(self):
+    @pytest.mark.slow
+    def test_kiro_cli_basic_functionality(self, kiro_version):
         """Test basic kiro-cli functionality."""
-        try:
-            result = subprocess.run(
-                ["kiro-cli", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            # Should either succeed or fail gracefully
-            assert result.returncode in [0, 1, 2]  # Various exit codes are acceptable
-        except subprocess.TimeoutExpired:
-            pytest.skip("kiro-cli command timed out")
-        except FileNotFoundError:
-            pytest.skip("kiro-cli not found in PATH")
+        # Should either succeed or fail gracefully
+        assert kiro_version.returncode in [0, 1, 2]  # Various exit codes are acceptable
     
-    @pytest.mark.skipif(not shutil.which("kiro-cli"), reason="kiro-cli not available")
-    def test_ai_steering_generation_integration(self, runner):
+    @pytest.mark.slow
+    @pytest.mark.skipif(not HAS_KIRO, reason="kiro-cli not available")
+    def test_ai_steering_generation_integration(self, runner, test_dir):
         """Test AI steering generation with kiro-cli integration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            steering_dir = Path(temp_dir) / ".kiro" / "steering"
-            
-            # Test with minimal goal to avoid timeout
-            result = runner.invoke(app, [
-                "init-steering",
-                str(steering_dir),
-                "--mode", "ai",
-                "--template", "blank", 
-                "--goal", "test project",
-                "--file", "steering.md",
-                "--kiro-timeout", "10",
-                "--kiro-trust-none",
-                "--kiro-wrap", "never"
-            ])
-            
-            # Should either succeed or fail gracefully with timeout/error
-            # Don't assert success since AI generation can be flaky
-            assert result.exit_code in [0, 1]
-            
-            if result.exit_code == 0:
-                assert (steering_dir / "steering.md").exists()
+        steering_dir = test_dir / ".kiro" / "steering"
+        
+        # Test with minimal goal to avoid timeout
+        result = runner.invoke(app, [
+            "init-steering",
+            str(steering_dir),
+            "--mode", "ai",
+            "--template", "blank", 
+            "--goal", "test project",
+            "--file", "steering.md",
+            "--kiro-timeout", "10",
+            "--kiro-trust-none",
+            "--kiro-wrap", "never"
+        ])
+        
+        # Should either succeed or fail gracefully with timeout/error
+        # Don't assert success since AI generation can be flaky
+        assert result.exit_code in [0, 1]
+        
+        if result.exit_code == 0:
+            assert (steering_dir / "steering.md").exists()
 
 
 class TestErrorHandling:
@@ -208,15 +206,19 @@ class TestErrorHandling:
         assert "not empty" in result.stdout.lower()
 
 
+@pytest.fixture(scope="session")
+def manager():
+    """The global template manager, shared by the session."""
+    from kiroforge.templates import get_template_manager
+    
+    return get_template_manager()
+
+
 class TestTemplateSystem:
     """Test the external template system."""
     
-    def test_template_loading(self):
+    def test_template_loading(self, manager):
         """Test that templates can be loaded from external files."""
-        from kiroforge.templates import get_template_manager
-        
-        manager = get_template_manager()
-        
         # Test available template sets
         sets = manager.get_template_sets()
         assert "foundational" in sets
@@ -233,12 +235,11 @@ class TestTemplateSystem:
         product_content = manager.get_template_content("foundational", "product.md")
         assert "# Product Overview" in product_content
         assert "TODO" in product_content
+        assert product_content == foundational_templates["product.md"]
     
-    def test_template_error_handling(self):
+    def test_template_error_handling(self, manager):
         """Test template error handling."""
-        from kiroforge.templates import get_template_manager, TemplateNotFoundError
-        
-        manager = get_template_manager()
+        from kiroforge.templates import TemplateNotFoundError
         
         # Test non-existent template set
         with pytest.raises(TemplateNotFoundError):
@@ -248,6 +249,15 @@ class TestTemplateSystem:
         with pytest.raises(TemplateNotFoundError):
             manager.get_template_content("foundational", "nonexistent.md")
 
+    def test_agent_and_collection_templates(self, manager):
+        """Test that agent and collection templates are discovered."""
+        assert "coordinator" in manager.get_agent_templates()
+        assert "backend-team" in manager.get_collection_templates()
+
+        infos = manager.get_all_agent_template_infos()
+        assert [info["name"] for info in infos] == manager.get_agent_templates()
+        assert infos == [manager.get_agent_template_info(info["name"]) for info in infos]
+
 
 class TestConfigurationSystem:
     """Test the configuration system."""
@@ -265,16 +275,18 @@ class TestConfigurationSystem:
         assert config.kiro.timeout == 60
     
     def test_configuration_validation(self):
-        """Test configuration validation."""
+        """Test that valid router settings build a configuration."""
         from kiroforge.config import KiroForgeConfig, RouterConfig
         
-        # Test valid configuration
-        config = KiroForgeConfig(
-            router=RouterConfig(min_score=5, max_results=20)
-        )
+        config = KiroForgeConfig(router=RouterConfig(min_score=5, max_results=20))
         assert config.router.min_score == 5
         assert config.router.max_results == 20
+    
+    def test_configuration_validation_rejects(self):
+        """Test that invalid router settings are rejected."""
+        from pydantic import ValidationError
+        
+        from kiroforge.config import RouterConfig
         
-        # Test invalid configuration should raise validation error
-        with pytest.raises(Exception):  # Pydantic validation error
-            RouterConfig(min_score=-1)  # Should fail ge=0 constraint
\ No newline at end of file
+        with pytest.raises(ValidationError):
+            RouterConfig(min_score=-1)  # Should fail ge=0 constraint
@@ -0,0 +1,29 @@
+from pathlib import Path
+import re
+
+import pytest
+
+from kiroforge.parser import AgentSpecFormatError, load_agent_spec, load_power_specs
+
+
+def test_load_power_specs_attributes_errors(tmp_path: Path) -> None:
+    good = tmp_path / "demo"
+    good.mkdir()
+    (good / "POWER.md").write_text(
+        "meta:\n  name: demo\n  description: A demo power\n  version: 1.0.0\n", encoding="utf-8"
+    )
+    bad = tmp_path / "bad"
+    bad.mkdir()
+    (bad / "POWER.md").write_text("- not a mapping\n", encoding="utf-8")
+    # Folders without a POWER.md are skipped rather than reported
+    (tmp_path / "empty").mkdir()
+
+    specs, errors = load_power_specs(tmp_path)
+    assert [spec.meta.name for spec in specs] == ["demo"]
+    assert [path for path, _ in errors] == [bad / "POWER.md"]
+
+
+def test_load_agent_spec_yaml_error_names_file(tmp_path: Path) -> None:
+    (tmp_path / "agent.yaml").write_text("meta: [\n", encoding="utf-8")
+    with pytest.raises(AgentSpecFormatError, match=re.escape(str(tmp_path / "agent.yaml"))):
+        load_agent_spec(tmp_path)
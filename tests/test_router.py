@@ -1,5 +1,18 @@
-from kiroforge.models import PowerSpec
-from kiroforge.router import select_powers
+from kiroforge.models import PowerSpec, PowerTrigger
+from kiroforge.router import score_power, select_powers
+
+
+def _demo_spec(**triggers: list[str]) -> PowerSpec:
+    return PowerSpec.model_validate(
+        {
+            "meta": {
+                "name": "demo",
+                "description": "Demo power for routing.",
+                "version": "0.1.0",
+            },
+            "triggers": triggers,
+        }
+    )
 
 
 def test_route_matches_phrase() -> None:
@@ -16,3 +29,45 @@ def test_route_matches_phrase() -> None:
     matches = select_powers([spec], "Use the demo power now")
     assert matches
     assert matches[0].name == "demo"
+
+
+def test_routing_leaves_spec_equality_alone() -> None:
+    routed = _demo_spec(phrases=["demo power"])
+    other = _demo_spec(phrases=["demo power"])
+    assert select_powers([routed], "Use the demo power now")
+    assert routed == other
+
+
+def test_copied_spec_routes_on_its_own_triggers() -> None:
+    spec = _demo_spec(phrases=["demo power"])
+    score_power(spec, "Use the demo power now")
+
+    copy = spec.model_copy(update={"triggers": PowerTrigger(phrases=["other thing"])})
+    fresh = _demo_spec(phrases=["other thing"])
+    assert score_power(copy, "Use the demo power now") == score_power(fresh, "Use the demo power now")
+
+
+def test_score_power_reuses_result_for_repeated_prompt() -> None:
+    spec = PowerSpec.model_validate(
+        {
+            "meta": {
+                "name": "demo",
+                "description": "Demo power for routing.",
+                "version": "0.1.0",
+            },
+            "triggers": {"phrases": ["demo power"], "files": ["*.py"]},
+        }
+    )
+    first = score_power(spec, "Use the demo power now", files=["app.py"])
+    assert score_power(spec, "Use the demo power now", files=iter(["app.py"])) is first
+    assert score_power(spec, "Use the demo power now") is not first
+
+
+def test_edited_triggers_are_not_served_cached_results() -> None:
+    spec = _demo_spec(phrases=["demo power"])
+    before = score_power(spec, "Use the demo power now")
+
+    spec.triggers.phrases[:] = ["other thing"]
+    after = score_power(spec, "Use the demo power now")
+    assert after is not before
+    assert after == score_power(_demo_spec(phrases=["other thing"]), "Use the demo power now")
@@ -2,9 +2,24 @@ from pathlib import Path
 
 from kiroforge.steering import validate_steering
 
+_STEERING_BYTES = b"# Project Steering\n\nContent"
+
 
 def test_validate_steering_ok(tmp_path: Path) -> None:
     steering = tmp_path / "steering.md"
-    steering.write_text("# Project Steering\n\nContent", encoding="utf-8")
+    steering.write_bytes(_STEERING_BYTES)
     result = validate_steering(steering)
     assert result.ok
+
+
+def test_validate_steering_filename_style(tmp_path: Path) -> None:
+    content = "# Standards\n\nUse snake_case because it is the project norm.\n\n```py\nx = 1\n```\n"
+    message = "Filename should be clear and kebab-case (e.g., api-standards.md)"
+
+    good = tmp_path / "api-standards.md"
+    good.write_text(content, encoding="utf-8")
+    assert message not in [issue.message for issue in validate_steering(good).issues]
+
+    bad = tmp_path / "API_Standards.md"
+    bad.write_text(content, encoding="utf-8")
+    assert message in [issue.message for issue in validate_steering(bad).issues]
@@ -1,17 +1,130 @@
+import dataclasses
 from pathlib import Path
+import shutil
 
-from kiroforge.validator import validate_power
+import pytest
 
+from kiroforge.validator import ValidationIssue, ValidationResult, validate_collection, validate_power
 
-def test_demo_power_validates() -> None:
-    power_dir = Path(__file__).parents[1] / "examples" / "kiro_powers" / "demo-power"
-    result = validate_power(power_dir)
+
+@pytest.mark.parametrize("name", ["demo-power", "mcp-hook-power"])
+def test_example_power_validates(validated_examples: dict[str, ValidationResult], name: str) -> None:
+    result = validated_examples[name]
     assert result.ok, [issue.message for issue in result.issues]
 
 
-def test_mcp_hook_power_validates() -> None:
-    power_dir = (
-        Path(__file__).parents[1] / "examples" / "kiro_powers" / "mcp-hook-power"
+def test_resource_paths_are_checked_by_where_they_resolve(tmp_path: Path) -> None:
+    power_dir = tmp_path / "power"
+    (power_dir / "sub").mkdir(parents=True)
+    (power_dir / "steering.md").write_text("# Steering\n", encoding="utf-8")
+    (tmp_path / "outside.md").write_text("# Outside\n", encoding="utf-8")
+    (power_dir / "POWER.md").write_text(
+        "meta:\n"
+        "  name: demo\n"
+        "  description: Power with roundabout resource paths.\n"
+        '  version: "0.1.0"\n'
+        "resources:\n"
+        "  steering_files:\n"
+        "    - steering.md\n"
+        "    - sub/../steering.md\n"
+        f"    - {power_dir / 'steering.md'}\n"
+        "    - sub/../../outside.md\n"
+        f"    - {tmp_path / 'outside.md'}\n",
+        encoding="utf-8",
     )
     result = validate_power(power_dir)
-    assert result.ok, [issue.message for issue in result.issues]
+    # In-tree ".." and absolute paths are accepted; escaping ones are not
+    assert [issue.message for issue in result.issues] == [
+        "Steering file path outside power directory: sub/../../outside.md",
+        f"Steering file path outside power directory: {tmp_path / 'outside.md'}",
+    ]
+
+
+def test_many_resource_paths_report_only_missing_ones(tmp_path: Path) -> None:
+    (tmp_path / "steering").mkdir()
+    present = [f"steering/s{i}.md" for i in range(6)]
+    for rel_path in present:
+        (tmp_path / rel_path).write_text("# Steering\n", encoding="utf-8")
+    missing = ["steering/gone.md", "assets/img.png", "assets/icons/logo.svg"]
+    steering = [rel_path for rel_path in present + missing if rel_path.startswith("steering/")]
+    (tmp_path / "POWER.md").write_text(
+        "meta:\n"
+        "  name: demo\n"
+        "  description: Power with enough resources to share listings.\n"
+        '  version: "0.1.0"\n'
+        "resources:\n"
+        "  steering_files:\n"
+        + "".join(f"    - {rel_path}\n" for rel_path in steering)
+        + "  assets:\n"
+        "    - assets/img.png\n"
+        "    - assets/icons/logo.svg\n",
+        encoding="utf-8",
+    )
+    result = validate_power(tmp_path)
+    assert [issue.message for issue in result.issues] == [
+        "Missing steering file: steering/gone.md",
+        "Missing asset: assets/img.png",
+        "Missing asset: assets/icons/logo.svg",
+    ]
+
+
+def test_dangling_symlink_resource_is_reported_missing(tmp_path: Path) -> None:
+    try:
+        (tmp_path / "steering.md").symlink_to(tmp_path / "gone.md")
+    except OSError:
+        pytest.skip("symlinks not supported")
+    (tmp_path / "POWER.md").write_text(
+        "meta:\n"
+        "  name: demo\n"
+        "  description: Power whose steering file is a broken link.\n"
+        '  version: "0.1.0"\n'
+        "resources:\n"
+        "  steering_files:\n"
+        "    - steering.md\n",
+        encoding="utf-8",
+    )
+    result = validate_power(tmp_path)
+    assert [issue.message for issue in result.issues] == ["Missing steering file: steering.md"]
+
+
+def _write_agent(agent_dir: Path, power_dir: Path, extra: str = "") -> None:
+    shutil.copytree(power_dir, agent_dir / "powers" / "demo-power")
+    (agent_dir / "prompt.md").write_text("# Agent\n", encoding="utf-8")
+    (agent_dir / "tests").mkdir()
+    (agent_dir / "agent.yaml").write_text(
+        f"meta:\n  name: {agent_dir.name}\n  description: A test agent\n  version: 1.0.0\n"
+        "identity:\n  prompt_file: prompt.md\n"
+        "powers:\n  - ./powers/demo-power\n" + extra,
+        encoding="utf-8",
+    )
+
+
+def test_collection_reports_each_agent_result(tmp_path: Path, example_powers: Path) -> None:
+    power_dir = example_powers / "demo-power"
+    _write_agent(tmp_path / "agents" / "reviewer", power_dir)
+    # The lead's error message names the reviewer among the available agents
+    _write_agent(
+        tmp_path / "agents" / "lead",
+        power_dir,
+        "subagents:\n  allowed_specialists:\n    - ghost\n",
+    )
+    (tmp_path / "collection.yaml").write_text(
+        "meta:\n  name: team\n  description: A review team\n  version: 1.0.0\n"
+        "agents:\n"
+        "  - path: ./agents/lead\n    role: lead\n"
+        "  - path: ./agents/reviewer\n    role: reviewer\n",
+        encoding="utf-8",
+    )
+
+    result = validate_collection(tmp_path)
+    assert any("reviewer" in issue.message for issue in result.issues)
+    assert not result.agent_results["./agents/lead"].ok
+    assert result.agent_results["./agents/reviewer"].ok
+
+
+def test_validation_result_cannot_be_changed_after_construction() -> None:
+    result = ValidationResult([ValidationIssue("warning", "minor")])
+    assert result.ok
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.issues = [ValidationIssue("error", "late")]
+    assert result.ok